@@ -1,406 +1,384 @@
+import hashlib
+import io
+import json
 import os
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
 
+import diskcache
+import httpx
 import streamlit as st
-from openai import OpenAI
+from openai import APIError, DefaultHttpxClient, NotFoundError, OpenAI
+from openai.types.beta.threads import Message
 
 __version__ = "1.0.0"
 
+MAX_RETRIES = 3
+INITIAL_RETRY_DELAY = 2.0  # seconds, doubled after every failed run
+MAX_RETRY_DELAY = 8.0
+
+ASSISTANT_MODEL = "gpt-4-1106-preview"
+ASSISTANT_TOOLS = [{"type": "code_interpreter"}]
+
+FILE_REGISTRY_PATH = Path(".file_registry.json")
+ASSISTANT_REGISTRY_PATH = Path(".assistants.json")
+
 # --- Initialization ---
 st.set_page_config(
     page_title=f"survey123-assistant v{__version__}",
     page_icon="🦜",
 )
 
-if "session_id" not in st.session_state:
-    st.session_state.session_id = str(uuid.uuid4())
-
-if "run" not in st.session_state:
-    st.session_state.run = {"status": None}
-
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-
-if "retry_error" not in st.session_state:
-    st.session_state.retry_error = 0
-
-if "thread_id" not in st.session_state:
-    st.session_state.thread_id = None
-
-
-def st_init_null(*variable_names) -> None:
-    for variable_name in variable_names:
-        if variable_name not in st.session_state:
-            st.session_state[variable_name] = None
-
-
-st_init_null(
-    "file_id",
-    "INSTRUCTIONS",
-    "run",
-    "assistant",
-    "output_content",
-    "thread",
-)
-
-client = OpenAI(
-    organization=os.environ["OPENAI_ORG_ID"],
-    api_key=os.environ["OPENAI_API_KEY"],
+SESSION_DEFAULTS = {
+    "session_id": None,
+    "rendered_messages": [],
+    "thread_id": None,
+    "file_id": None,
+    "INSTRUCTIONS": None,
+    "run": None,
+    "assistant_id": None,
+    "output_content": None,
+    "thread": None,
+}
+missing_keys = SESSION_DEFAULTS.keys() - st.session_state.keys()
+st.session_state.update(
+    {
+        key: str(uuid.uuid4()) if key == "session_id" else SESSION_DEFAULTS[key]
+        for key in missing_keys
+    },
 )
 
-INSTRUCTIONS_template = """
-You are a helpful chatbot styled after Columbo. Make funny, bumbling jokes while persistently inquiring about the user's goals and motivations so you can be more helpful.
-
-I've given you a file called `/mnt/data/{}`. Rename it to `xlsform_orm.py`. Then you'll need to make it available in your Python path to use it.
-
-While trying to rename the file and add it to path, do not directly tell the user what you're doing or what challenges you're facing. They are not technical like that.
-
-Use the `xlsform_orm` Python module to fulfill the user's requests. But before you start, ask the user a few questions about exactly what it is they want.
-
-```README.md
-# xlsform_orm
-
-Surveys as object-oriented code
-
-## Prerequisites
-
-* [pandas](https://pandas.pydata.org/)
-* [pydantic](https://docs.pydantic.dev/latest/)
-
-## Components
-
-  * `Question`
-  * `Range`
-  * `Choice`
-  * `QuestionGroup`
-  * `Logic`
-  * `Survey`
-  * `Survey.yaml()`
-  * `Survey.json()`
-  * `Survey.save_to_excel()`
-
-## Usage
-
-As explained by an AI:
-
-**Question**: Use xlsform_orm's Survey and Question classes to make a survey for name, age, and favorite color.
-
-**Answer**: To create a survey using xlsform_orm's Survey and Question classes, you can follow these steps:
-
-1. Import the required classes from the package.
-2. Create Question objects for each question you want to include in the survey.
-3. Create a Survey object and add the Question objects to its items list.
-4. (Optional) Save the survey to an Excel file.
 
-Here's an example of how you can create a survey with questions for name, age, and favorite color:
+def read_registry(registry_path: Path) -> Dict[str, str]:
+    return json.loads(registry_path.read_text()) if registry_path.exists() else {}
 
-```python
 
-from xlsform_orm import Question, Survey, QuestionTypes
-
-# Create questions for name, age, and favorite color
-name_question = Question(
-  type=QuestionTypes.text,
-  name="name",
-  label="What is your name?"
-)
-
-age_question = Question(
-  type=QuestionTypes.integer,
-  name="age",
-  label="What is your age?"
-)
+@st.cache_resource
+def get_client() -> OpenAI:
+    return OpenAI(
+        organization=os.environ["OPENAI_ORG_ID"],
+        api_key=os.environ["OPENAI_API_KEY"],
+        # keep connections alive between calls and multiplex the concurrent ones
+        http_client=DefaultHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        ),
+    )
 
-color_question = Question(
-  type=QuestionTypes.text,
-  name="favorite_color",
-  label="What is your favorite color?"
-)
 
-# Create a survey and add the questions to its items list
-my_survey = Survey(name="personal_info_survey", label="Personal Information Survey",
-                   items=[name_question, age_question, color_question])
+@st.cache_data(show_spinner=False)
+def get_file_id(file_path: str, mtime: float, size: int) -> str:
+    # mtime and size key the cache, so editing the file triggers a fresh lookup;
+    # the registry on disk keeps identical content from being re-uploaded on restart
+    file_bytes = Path(file_path).read_bytes()
+    file_hash = hashlib.sha256(file_bytes).hexdigest()
+    registry = read_registry(FILE_REGISTRY_PATH)
+    if file_hash not in registry:
+        file_buffer = io.BytesIO(file_bytes)
+        file_buffer.name = Path(file_path).name
+        file = get_client().files.create(file=file_buffer, purpose="assistants")
+        registry[file_hash] = file.id
+        FILE_REGISTRY_PATH.write_text(json.dumps(registry, indent=2))
+    return registry[file_hash]
+
+
+@st.cache_resource
+def get_assistant_id(instructions: str, file_id: str) -> str:
+    # identical for every session, so one assistant is shared by the whole process
+    # and the registry on disk keeps restarts from creating orphaned duplicates
+    assistant_key = hashlib.sha256(
+        "\x00".join(
+            [instructions, ASSISTANT_MODEL, json.dumps(ASSISTANT_TOOLS), file_id],
+        ).encode(),
+    ).hexdigest()
+    registry = read_registry(ASSISTANT_REGISTRY_PATH)
+    if assistant_key not in registry:
+        assistant = get_client().beta.assistants.create(
+            instructions=instructions,
+            model=ASSISTANT_MODEL,
+            tools=ASSISTANT_TOOLS,
+            tool_resources={"code_interpreter": {"file_ids": [file_id]}},
+        )
+        registry[assistant_key] = assistant.id
+        ASSISTANT_REGISTRY_PATH.write_text(json.dumps(registry, indent=2))
+    return registry[assistant_key]
+
+
+def forget_deleted_resources() -> bool:
+    # registry ids are trusted across restarts, so drop the ones deleted on
+    # OpenAI's side; a new file id also keys a new assistant
+    client = get_client()
+    forgot = False
+    for registry_path, retrieve, resource_id, cached_lookup in (
+        (
+            FILE_REGISTRY_PATH,
+            client.files.retrieve,
+            st.session_state.file_id,
+            get_file_id,
+        ),
+        (
+            ASSISTANT_REGISTRY_PATH,
+            client.beta.assistants.retrieve,
+            st.session_state.assistant_id,
+            get_assistant_id,
+        ),
+    ):
+        try:
+            retrieve(resource_id)
+        except NotFoundError:
+            registry = read_registry(registry_path)
+            registry = {k: v for k, v in registry.items() if v != resource_id}
+            registry_path.write_text(json.dumps(registry, indent=2))
+            cached_lookup.clear()
+            forgot = True
+    return forgot
+
+
+@st.cache_data(show_spinner=False)
+def load_template() -> str:
+    return Path("instructions.md").read_text().strip()
+
+
+@st.cache_data(show_spinner=False)
+def get_instructions(file_id: str) -> str:
+    # the file_id is formatted in at the very end to keep the prompt prefix stable
+    return load_template().format(file_id)
+
+
+@st.cache_resource
+def get_response_cache() -> diskcache.Cache:
+    return diskcache.Cache(".openai_cache")
+
+
+def get_cache_key(
+    assistant_id: str,
+    messages: Iterable[Tuple[str, str]],
+    prompt: str,
+) -> str:
+    # the same prompt only gets the same answer from the same thread state
+    history = (text for _, text in messages)
+    return hashlib.sha256(
+        "\x00".join([assistant_id, *history, prompt]).encode(),
+    ).hexdigest()
+
+
+def get_transcript_entry(message: Message) -> Tuple[str, str]:
+    # keep only what the UI renders instead of the whole Message model
+    message_texts = [
+        attachment.file_id for attachment in (message.attachments or [])[:1]
+    ]
+    message_texts += [
+        content_part.text.value
+        for content_part in message.content
+        if content_part.type == "text"
+    ]
+    return message.role, "\n\n".join(message_texts)
+
+
+def is_replayable(message: Message) -> bool:
+    # a replay only posts text back, so images or empty messages can't be cached
+    return bool(message.content) and all(
+        content_part.type == "text" and content_part.text.value
+        for content_part in message.content
+    )
 
-# (Optional) Save the survey to an Excel file
-my_survey.save_to_excel("personal_info_survey.xlsx")
-```
 
-This will create a survey with the specified questions and save it to an Excel file called "personal_info_survey.xlsx".
+def resolve_assistant() -> None:
+    xlsform_orm_stat = os.stat("xlsform_orm.py")
+    st.session_state.file_id = get_file_id(
+        "xlsform_orm.py",
+        xlsform_orm_stat.st_mtime,
+        xlsform_orm_stat.st_size,
+    )
+    st.session_state.INSTRUCTIONS = get_instructions(st.session_state.file_id)
+    st.session_state.assistant_id = get_assistant_id(
+        st.session_state.INSTRUCTIONS,
+        st.session_state.file_id,
+    )
 
-**Question**: Make color multiple choice
 
-**Answer**: To modify the favorite color question to be a multiple-choice question instead of a text input, ~~you need to create a `MultipleChoice` object instead of a `Question` object~~. You should also define the choices for the multiple-choice question using the `Choice` class. Here's an example:
+@st.fragment
+def render_messages(messages: Iterable[Tuple[str, str]]) -> None:
+    for role, text in messages:
+        with st.chat_message(role):
+            st.markdown(text)
 
-```python
-from xlsform_orm import Choice, QuestionTypes, Question
 
-# Define the choices
-option_red = Choice(value='red', label='Red')
-option_green = Choice(value='green', label='Green')
-option_blue = Choice(value='blue', label='Blue')
+@st.fragment
+def render_download_button() -> None:
+    if st.session_state.output_content:
+        st.download_button(
+            "Download Output",
+            st.session_state.output_content,
+            key=f"dl_{len(st.session_state.output_content)}",
+        )
 
-# Create the multiple-choice question
-favorite_color_question = Question(
-  name='favorite_color',
-  label='What is your favorite color?',
-  type=QuestionTypes.select_one,
-  choices=[option_red, option_green, option_blue],
-  allow_other=False,
-)
-```
 
-In this example, the `favorite_color_question` is a multiple-choice question with three choices: Red, Green, and Blue. The question type is set to `Multiple_Choice_Type.select_one`, which means the user can select only one choice.
+client = get_client()
 
-For more examples, see `tests/test_*.py`, for example `tests/test_surveys.py`:
 
-```python
-import os
-from tempfile import TemporaryDirectory
-
-import pandas as pd
-
-from xlsform_orm import Choice, Survey, QuestionGroup, Question
-
-
-def test_survey():
-  questions = [
-    Question(type="text", name="text_question", label="What is your name?"),
-    Question(type="integer", name="integer_question", label="How old are you?"),
-    Question(type="decimal", name="decimal_question", label="Height (meters),"),
-    Question(
-      type="geopoint",
-      name="geopoint_question",
-      label="Location",
-      accuracyThreshold=5.0,
-    ),
-    Question(type="geotrace", name="geotrace_question", label="Trace your path"),
-    Question(
-      type="geoshape",
-      name="geoshape_question",
-      label="Draw the boundary of the study area",
-    ),
-    Question(type="image", name="image_question", label="Take a photo of the area"),
-    Question(
-      type="audio",
-      name="audio_question",
-      label="Record a 30 second audio clip describing the sounds you hear",
-    ),
-    Question(type="date", name="date_question", label="Date of visit"),
-    Question(type="time", name="time_question", label="Time of visit"),
-    Question(
-      type="dateTime",
-      name="dateTime_question",
-      label="Date and time of visit",
-    ),
-    Question(
-      type="calculate",
-      name="calculate_question",
-      label="Calculated total:",
-      calculation="q2 + q3 + q4",  # Add q2, q3 and q4
-    ),
-    # disabled until parse_excel knows what to do
-    # Question(
-    #     type="range",
-    #     name="range_question",
-    #     label="Number of individuals observed:",
-    #     range=Range(start=0, end=100, step=5),
-    # ),
-    Question(
-      type="rank",
-      name="rank_question",
-      label="Rank the following colors by preference:",
-      choices=[
-        Choice(value="r", label="Red"),
-        Choice(value="b", label="Blue"),
-        Choice(value="g", label="Green"),
-      ],
-    ),
-    Question(
-      type="select_one",
-      name="select_one_question",
-      label="What is your favorite color?",
-      choices=[
-        Choice(value="r", label="Red"),
-        Choice(value="b", label="Blue"),
-        Choice(value="g", label="Green"),
-      ],
-    ),
-    Question(
-      type="select_multiple",
-      name="select_multiple_question",
-      label="Select all that apply:",
-      choices=[
-        Choice(value="a", label="Apple"),
-        Choice(value="b", label="Banana"),
-        Choice(value="o", label="Orange"),
-      ],
-      allow_other=True,
-    ),
-    Question(
-      type="select_one_from_file",
-      name="select_one_from_file_question",
-      label="Select an option:",
-      file="choices.csv",  # File containing choices
-    ),
-    Question(
-      type="select_multiple_from_file",
-      name="select_multiple_from_file_question",
-      label="Select all that apply:",
-      file="choices.csv",
-    ),
-    Question(type="note", name="note1", label="This is a note!"),
-    Question(type="file", name="file_question", label="Attach a file"),
-    Question(type="barcode", name="barcode_question", label="Scan a barcode"),
-    Question(type="hidden", name="instanceID", label="Instance ID"),
-    Question(type="username", name="username_question", label="Username"),
-    Question(type="email", name="email_question", label="Email address"),
-    Question(type="deviceid", name="deviceID", label="Device ID"),
-  ]
-
-  group = QuestionGroup(name="group_1", label="Group 1", items=questions)
-
-  survey = Survey(name="survey_1", label="Survey 1", items=[group])
-
-  assert survey == Survey.parse_obj(survey.dict())  # test object translation
-  assert survey == Survey.parse_raw(survey.json())  # test json translation
-  assert survey == Survey.parse_yaml(survey.yaml())  # test yaml translation
-
-  with TemporaryDirectory() as tmpdir:
-    # save survey as a yaml file
-    yaml_file_path = os.path.join(tmpdir, "temp.yml")
-    # read it in
-    survey.save_to_yaml(yaml_file_path)
-    # compare it to the original
-    assert survey == Survey.parse_yaml_file(yaml_file_path)
-
-    # save survey as Excel file
-    excel_file_path = os.path.join(tmpdir, "temp.xlsx")
-    # read it in
-    survey.save_to_excel(excel_file_path)
-    # check for 3 expected sheet names (no more, no less)
-    # does not actually check validity or logic of sheets
-    sheet_names = pd.read_excel(excel_file_path, sheet_name=None).keys()
-    assert set(sheet_names) == {{"survey", "choices", "settings"}}
-
-    # check the actual parsing
-    assert survey == Survey.parse_excel(excel_file_path)
-
-```
-
-```instructions.txt
-Common Patterns and Idiomatic Use Object Structure: Surveys are constructed using Question, QuestionGroup, and Survey objects. Questions are the basic elements that can have various types (text, integer, select_one, etc.), labels, and additional parameters. Groups encapsulate multiple questions or other groups, and a Survey is the top-level object containing all the questions and groups. Defining Questions: Instantiate Question objects with the required type, name, and label. Depending on the type, you may also include specific fields like choices for select_one questions or calculation for calculate questions. Grouping Questions: Use QuestionGroup to logically group questions. Groups can also have their own logic, such as skipping the entire group based on a condition. Logic and Flow Control: Apply logic at the question or group level using the Logic object. This can control visibility, skipping, constraints, etc., based on expressions that refer to the answers of other questions. Survey Creation: Once all questions and groups are defined, create a Survey object, passing an array of items (questions or groups) and a name and label for the survey. Exporting: Use the save_to_excel method on the Survey object to export the entire survey structure to an XLSForm-compliant Excel file. Anti-Patterns Hardcoding Choices: Avoid hardcoding choices for select_one or select_multiple questions. Instead, use the Choice class to define them for maintainability. Ignoring Validation: Do not ignore the built-in validators. They help ensure that the survey structure adheres to XLSForm standards. Complex Expressions in Logic: Keep logic expressions simple and maintainable. Complex expressions can be hard to debug and maintain. Common Errors Incompatible Types: Using incompatible types for fields, such as passing a string where an integer is expected, will raise a validation error. Reserved Keywords: Using reserved keywords as question names will raise a ValueError. Invalid Appearance Attributes: Specifying appearance attributes that are incompatible with the question type will also raise a ValueError. Missing Required Fields: Omitting required fields like type or label when defining questions or groups will result in errors. Best Practices Incremental Development: Build the survey incrementally, verifying each part as you go along to catch errors early. Use Enums: Wherever possible, use the enums provided by the library for setting values like question types or logic types to avoid typos and invalid values. Reusability: Define common choices and logic as reusable objects to avoid duplication. Comments and Documentation: Comment your survey definition code and provide documentation for complex logic or group structures to aid in maintenance and understanding. Error Handling: Implement error handling when parsing or exporting surveys to gracefully handle any issues that arise. Version Control: Keep your survey definitions under version control for collaboration and to track changes over time. This guidance ensures that an LLM using the xlsform_orm library can do so effectively, following best practices while avoiding common pitfalls.
-```
-""".strip()
-
-prompt = st.chat_input(placeholder="Ask me a question!")
-
-if st.session_state.file_id is None:
-    file = client.files.create(
-        file=open("xlsform_orm.py", "rb"),
-        purpose="assistants",
-    )
-    st.session_state.file_id = file.id
-else:
-    st.session_state.INSTRUCTIONS = INSTRUCTIONS_template.format(
-        st.session_state.file_id,
-    )
+# A new session's thread doesn't depend on the file or the assistant,
+# so create it while those are looked up (or created, on a cold start)
+with ThreadPoolExecutor(max_workers=1) as executor:
+    if st.session_state.thread is None:
+        thread_future = executor.submit(client.beta.threads.create)
 
-if st.session_state.INSTRUCTIONS is not None:
-    if st.session_state.assistant is None:
-        st.session_state.assistant = client.beta.assistants.create(
-            instructions=st.session_state.INSTRUCTIONS,
-            model="gpt-4-1106-preview",
-            tools=[{"type": "code_interpreter"}],
-            file_ids=[st.session_state.file_id],
-        )
+    resolve_assistant()
 
     if st.session_state.thread is None:
-        st.session_state.thread = client.beta.threads.create()
+        st.session_state.thread = thread_future.result()
+
 
+render_messages(st.session_state.rendered_messages)
 
 if prompt := st.chat_input("How can I help you?"):
-    with st.chat_message("user"):
+    placeholder = st.empty()
+    turn = placeholder.container()
+    with turn.chat_message("user"):
         st.write(prompt)
 
-    # Add message to the thread
-    st.session_state.messages = client.beta.threads.messages.create(
-        thread_id=st.session_state.thread.id,
-        role="user",
-        content=prompt,
+    response_cache = get_response_cache()
+    cache_key = get_cache_key(
+        st.session_state.assistant_id,
+        st.session_state.rendered_messages,
+        prompt,
     )
 
-    # Do a run to process the messages in the thread
-    st.session_state.run = client.beta.threads.runs.create(
-        thread_id=st.session_state.thread.id,
-        assistant_id=st.session_state.assistant.id,
-    )
-    if st.session_state.retry_error < 3:
-        time.sleep(1)  # Wait 1 second before checking run status
-        st.rerun()
-
-
-# Check if 'run' object has 'status' attribute
-while st.session_state.run is not None:
-    if hasattr(st.session_state.run, "status"):
-        # Handle the 'running' status
-        if st.session_state.run.status == "running":
-            with st.chat_message("assistant"):
-                st.write("Thinking ......")
-            if st.session_state.retry_error < 3:
-                time.sleep(
-                    1,
-                )  # Short delay to prevent immediate rerun, adjust as needed
-                st.rerun()
-
-        # Handle the 'failed' status
-        elif st.session_state.run.status == "failed":
-            st.session_state.retry_error += 1
-            with st.chat_message("assistant"):
-                if st.session_state.retry_error < 3:
-                    st.write("Run failed, retrying ......")
-                    time.sleep(3)  # Longer delay before retrying
-                    st.rerun()
-                else:
-                    st.error(
-                        "FAILED: The OpenAI API is currently processing too many requests. Please try again later ......",
-                    )
-
-        # Handle any status that is not 'completed'
-        elif st.session_state.run.status != "completed":
-            # Attempt to retrieve the run again, possibly redundant if there's no other status but 'running' or 'failed'
-            st.session_state.run = client.beta.threads.runs.retrieve(
+    response_placeholder = turn.empty()
+    completed = False
+    prompt_posted = False
+    assistant_messages = []
+    if cache_key in response_cache:
+        # Replay the prompt and the cached answer into the thread instead of doing a run
+        try:
+            client.beta.threads.messages.create(
                 thread_id=st.session_state.thread.id,
-                run_id=st.session_state.run.id,
+                role="user",
+                content=prompt,
             )
-            if st.session_state.retry_error < 3:
-                time.sleep(3)
-                st.rerun()
-        else:
-            # Retrieve the list of messages
-            st.session_state.messages = client.beta.threads.messages.list(
-                thread_id=st.session_state.thread.id,
+            prompt_posted = True
+            st.session_state.rendered_messages.append(("user", prompt))
+            for cached_message in response_cache[cache_key]:
+                assistant_messages.append(
+                    client.beta.threads.messages.create(
+                        thread_id=st.session_state.thread.id,
+                        role="assistant",
+                        content=cached_message["text"],
+                        attachments=[
+                            {
+                                "file_id": file_id,
+                                "tools": [{"type": "code_interpreter"}],
+                            }
+                            for file_id in cached_message["file_ids"]
+                        ],
+                    ),
+                )
+            completed = True
+        except APIError:
+            # drop the entry and fall back to a run that answers what the replay left off
+            response_cache.pop(cache_key, None)
+
+    if not completed:
+        # Stream a run that adds the prompt to the thread itself, rendering tokens as they arrive
+        pending_messages = (
+            None if prompt_posted else [{"role": "user", "content": prompt}]
+        )
+        retry_delay = INITIAL_RETRY_DELAY
+        failure_message = "FAILED: The OpenAI API is currently processing too many requests. Please try again later ......"
+        for attempt in range(1, MAX_RETRIES + 1):
+            try:
+                with response_placeholder.container(), st.chat_message("assistant"):
+                    response_area = st.empty()
+                    response_text = ""
+                    with client.beta.threads.runs.stream(
+                        thread_id=st.session_state.thread.id,
+                        assistant_id=st.session_state.assistant_id,
+                        additional_messages=pending_messages,
+                    ) as stream:
+                        # the run exists now, so retries must not post the prompt again,
+                        # and the transcript has to match the thread even if they all fail
+                        if pending_messages is not None:
+                            pending_messages = None
+                            st.session_state.rendered_messages.append(("user", prompt))
+                        for text in stream.text_deltas:
+                            response_text += text
+                            response_area.markdown(response_text)
+                        st.session_state.run = stream.get_final_run()
+                        # a run that did not complete usually has no messages to get
+                        if st.session_state.run.status == "completed":
+                            assistant_messages += stream.get_final_messages()
+            except NotFoundError:
+                st.session_state.run = None
+                if not forget_deleted_resources():
+                    failure_message = "FAILED: The conversation thread no longer exists. Please reload the page ......"
+                    break
+                # recreate the deleted file or assistant before retrying
+                resolve_assistant()
+            except APIError:
+                st.session_state.run = None
+
+            if (
+                st.session_state.run is not None
+                and st.session_state.run.status == "completed"
+            ):
+                if all(is_replayable(message) for message in assistant_messages):
+                    response_cache[cache_key] = [
+                        {
+                            "text": "\n\n".join(
+                                content_part.text.value
+                                for content_part in message.content
+                            ),
+                            "file_ids": [
+                                attachment.file_id
+                                for attachment in message.attachments or []
+                            ],
+                        }
+                        for message in assistant_messages
+                    ]
+                completed = True
+                break
+
+            if attempt < MAX_RETRIES:
+                with response_placeholder.container(), st.chat_message("assistant"):
+                    st.write("Run failed, retrying ......")
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+
+        if not completed:
+            with response_placeholder.container(), st.chat_message("assistant"):
+                st.error(failure_message)
+
+    if completed:
+        # Download output files concurrently instead of one round-trip at a time
+        output_file_ids = [
+            message.attachments[0].file_id
+            for message in assistant_messages
+            if message.attachments
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            api_responses = list(
+                executor.map(
+                    client.files.with_raw_response.retrieve_content,
+                    output_file_ids,
+                ),
             )
-
-            # Display messages
-            for message in reversed(list(st.session_state.messages)):
-                if message.role in ["user", "assistant"]:
-                    with st.chat_message(message.role):
-                        if message.file_ids:
-                            st.markdown(message.file_ids[0])
-                            api_response = (
-                                client.files.with_raw_response.retrieve_content(
-                                    message.file_ids[0],
-                                )
-                            )
-
-                            if api_response.status_code == 200:
-                                st.session_state.output_content = api_response.content
-
-                        for content_part in message.content:
-                            message_text = content_part.text.value
-                            st.markdown(message_text)
-            st.session_state.run = None
-
-if st.session_state.output_content:
-    st.download_button("Download Output", st.session_state.output_content)
+        for api_response in api_responses:
+            if api_response.status_code == 200:
+                st.session_state.output_content = api_response.content
+
+        # The turn already knows every message it added, so no list call is needed;
+        # the prompt went into the transcript as soon as it reached the thread
+        assistant_entries = [
+            get_transcript_entry(message) for message in assistant_messages
+        ]
+        st.session_state.rendered_messages += assistant_entries
+
+        # Display messages
+        with placeholder.container():
+            render_messages([("user", prompt), *assistant_entries])
+        st.session_state.run = None
+
+render_download_button()
@@ -1,10 +1,36 @@
 """Lightweight library supporting XLSForm-as-code."""
+import os
+import sys
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
-import pandas as pd
-import yaml
-from pydantic import BaseModel, Field, root_validator, validator
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class LogicTypes(Enum):
@@ -16,6 +42,33 @@ class LogicTypes(Enum):
     constraint = "constraint"
 
 
+def _enum_lookup(enum_type: Type[Enum]) -> Dict[str, str]:
+    """Map the name and the value of each enum member to its interned value."""
+    lookup = {
+        name: sys.intern(member.value) for name, member in enum_type.__members__.items()
+    }
+    lookup.update({value: value for value in lookup.values()})
+    return lookup
+
+
+def _validate_enum_value(
+    v: Any,
+    enum_type: Type[Enum],
+    lookup: Dict[str, str],
+    kind: str,
+) -> str:
+    """Return the value for an enum member, name or value, else raise ValueError."""
+    if isinstance(v, enum_type):
+        return v.value
+    value = lookup.get(v) if isinstance(v, str) else None
+    if value is None:
+        raise ValueError(f"Invalid {kind}")
+    return value
+
+
+_LOGIC_TYPE_LOOKUP = _enum_lookup(LogicTypes)
+
+
 class Logic(BaseModel):
     """
     Logic for flow control and constraints.
@@ -138,19 +191,23 @@ class Logic(BaseModel):
 
     """
 
-    type: Union[LogicTypes, str] = Field(..., description="logic type")
+    type: str = Field(..., description="logic type")
     expression: str = Field(..., description="logic expression")
     message: Optional[str] = Field(None, description="constraint message")
 
-    class Config:
-        """pydantic configuration."""
+    model_config = ConfigDict(frozen=True, coerce_numbers_to_str=True)
 
-        use_enum_values = True
+    @field_validator("type", mode="before")
+    @classmethod
+    def validate_type(cls, v):
+        """Raise ValueError unless type is a valid logic type."""
+        return _validate_enum_value(v, LogicTypes, _LOGIC_TYPE_LOOKUP, "logic type")
 
-    @validator("message")
-    def validate_message(cls, v, values):
+    @field_validator("message", mode="before")
+    @classmethod
+    def validate_message(cls, v, info: ValidationInfo):
         """Set message to None unless type == 'constraint'."""
-        if values["type"] != "constraint":
+        if info.data.get("type") != "constraint":
             v = None
         return v
 
@@ -161,20 +218,24 @@ class Choice(BaseModel):
     value: str = Field(..., description="The value of the choice")
     label: str = Field(..., description="The label of the choice")
 
+    model_config = ConfigDict(frozen=True, coerce_numbers_to_str=True)
+
 
 class Range(BaseModel):
-    """A value range for a range question."""
+    """A value range for a range question. Integer values are stored as floats."""
 
-    start: Union[int, float] = Field(
+    start: float = Field(
         ...,
         description="the value at which the range begins",
     )
-    end: Union[int, float] = Field(..., description="the value at which the range ends")
-    step: Union[int, float] = Field(
+    end: float = Field(..., description="the value at which the range ends")
+    step: float = Field(
         ...,
         description="the size of each division in the range",
     )
 
+    model_config = ConfigDict(frozen=True)
+
 
 class GroupTypes(Enum):
     """Valid group types."""
@@ -183,6 +244,9 @@ class GroupTypes(Enum):
     repeat = "repeat"
 
 
+_GROUP_TYPE_LOOKUP = _enum_lookup(GroupTypes)
+
+
 class QuestionTypes(Enum):
     """Valid question types."""
 
@@ -227,6 +291,9 @@ class QuestionTypes(Enum):
     # xml_external = "xml-external"
 
 
+_QUESTION_TYPE_LOOKUP = _enum_lookup(QuestionTypes)
+
+
 class AppearanceAttributes(Enum):
     """Valid appearance attributes."""
 
@@ -276,6 +343,26 @@ class AppearanceAttributes(Enum):
     spike_point_to_point = "spike-point-to-point"
 
 
+_CHOICE_TYPES = frozenset({"rank", "select_one", "select_multiple"})
+
+# (question types, associated field, required): the field must be set for these
+# types if required, and is cleared to None for every other type.
+_TYPE_FIELD_RULES: Tuple[Tuple[FrozenSet[str], str, bool], ...] = (
+    (frozenset({"calculate"}), "calculation", True),
+    (_CHOICE_TYPES, "choices", True),
+    (_CHOICE_TYPES, "allow_other", False),
+    (frozenset({"geopoint", "geotrace", "geoshape"}), "accuracyThreshold", False),
+    (
+        frozenset({"select_one_from_file", "select_multiple_from_file"}),
+        "file",
+        True,
+    ),
+)
+
+
+_APPEARANCE_ATTRIBUTE_LOOKUP = _enum_lookup(AppearanceAttributes)
+
+
 class Question(BaseModel):
     """
     A question of any type supported by XLSForm.
@@ -480,7 +567,7 @@ class Question(BaseModel):
 
     """
 
-    type: Union[QuestionTypes, str] = Field(..., description="xlsform question type")
+    type: str = Field(..., description="xlsform question type")
     name: str = Field(..., description="question name")
     label: str = Field(..., description="question label")
     required: Optional[bool] = Field(
@@ -498,7 +585,7 @@ class Question(BaseModel):
     )
 
     # range
-    range: Optional[Union[Range, Dict[str, Union[int, float]]]] = Field(
+    range: Optional[Range] = Field(
         None,
         description="parameters for range questions",
     )
@@ -528,88 +615,90 @@ class Question(BaseModel):
         None,
         description="parameter dict, specific to different question types",
     )
-    appearance_attributes: Optional[AppearanceAttributes] = Field(
+    appearance_attributes: Optional[str] = Field(
         None,
         description="question-level appearance attributes",
     )
 
-    class Config:
-        """pydantic configuration."""
+    model_config = ConfigDict(coerce_numbers_to_str=True)
 
-        use_enum_values = True
+    @field_validator("type", mode="before")
+    @classmethod
+    def validate_type(cls, v):
+        """Raise ValueError unless type is a valid question type."""
+        return _validate_enum_value(
+            v,
+            QuestionTypes,
+            _QUESTION_TYPE_LOOKUP,
+            "question type",
+        )
 
-    @validator("name")
-    def validate_name(cls, v, values):
-        """Raise ValueError if question name is a reserved keyword."""
-        if v in RESERVED_NAMES:
+    @field_validator("name", mode="before")
+    @classmethod
+    def validate_name(cls, v):
+        """Raise ValueError if question name is a reserved keyword (any case)."""
+        if isinstance(v, str) and v.upper() in RESERVED_NAMES:
             raise ValueError(f"{v} cannot be used as a question name")
         return v
 
-    @root_validator(pre=False)
-    def validate_by_type(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+    @model_validator(mode="after")
+    def validate_by_type(self) -> "Question":
         """Perform a number of validations based on value of `type` field."""
-        type = values["type"]
-
-        if not hasattr(QuestionTypes, type):
-            raise ValueError("Invalid question type")
+        type = self.type
 
-        def check_associated(
-            q_type: Union[str, Tuple[str, ...]],
-            associated_field: str,
-            required: bool = True,
-        ):
-            """Check for None if required; set None if unnecessary."""
-            q_type = (q_type,) if isinstance(q_type, str) else q_type
-            if type in q_type:
-                if required and values[associated_field] is None:
+        for q_types, associated_field, required in _TYPE_FIELD_RULES:
+            if type in q_types:
+                if required and getattr(self, associated_field) is None:
                     raise ValueError(
                         f"{associated_field} required for type '{type}'",
                     )
             else:
-                values[associated_field] = None
-
-        check_associated("calculate", "calculation")
-        check_associated(("rank", "select_one", "select_multiple"), "choices")
-        check_associated(
-            ("rank", "select_one", "select_multiple"),
-            "allow_other",
-            required=False,
-        )
-        check_associated(
-            ("geopoint", "geotrace", "geoshape"),
-            "accuracyThreshold",
-            required=False,
-        )
-        check_associated(("select_one_from_file", "select_multiple_from_file"), "file")
+                setattr(self, associated_field, None)
 
         if type == "range":
-            range_params = values["range"]
+            range_params = self.range
             if range_params is None:
                 raise ValueError("range cannot be None when type == 'range'")
-            parameters = values["parameters"] or {}
-            parameters["start"] = range_params.start
-            parameters["end"] = range_params.end
-            parameters["step"] = range_params.step
-            values["parameters"] = parameters
+            self.parameters = {
+                **(self.parameters or {}),
+                "start": range_params.start,
+                "end": range_params.end,
+                "step": range_params.step,
+            }
 
-        return values
+        appearance_attributes = self.appearance_attributes
+        if appearance_attributes is not None and not check_appearance_question_combo(
+            appearance_attributes,
+            type,
+        ):
+            raise ValueError(
+                f"appearance '{appearance_attributes}' is incompatible with type '{type}'",
+            )
+
+        return self
+
+    @field_validator("appearance_attributes", mode="before")
+    @classmethod
+    def validate_appearance_attributes(cls, v):
+        """Raise ValueError unless appearance_attributes is a valid appearance."""
+        if v is None:
+            return v
+        return _validate_enum_value(
+            v,
+            AppearanceAttributes,
+            _APPEARANCE_ATTRIBUTE_LOOKUP,
+            "appearance attribute",
+        )
 
-    @validator("appearance_attributes", pre=False)
-    def check_appearance_attributes(cls, appearance_attributes, values):
+    @classmethod
+    def from_trusted(cls, **data) -> "Question":
         """
-        Validate the appearance attributes for the question.
+        Return Question built from already-validated data, skipping validation.
 
-        Raises
-        ------
-        ValueError: If appearance is incompatible with question type.
+        Only use this for data produced by this library, such as another
+        Question's fields. Nested models must already be model instances.
         """
-        if appearance_attributes is None:
-            return appearance_attributes
-        appearance_attributes = appearance_attributes
-        type = values.get("type")
-        if not check_appearance_question_combo(appearance_attributes, type):
-            raise ValueError
-        return appearance_attributes
+        return cls.model_construct(**data)
 
 
 class QuestionGroup(BaseModel):
@@ -644,7 +733,7 @@ class QuestionGroup(BaseModel):
 
     """
 
-    type: str = Field(GroupTypes.group, description="xlsform entry type")
+    type: str = Field(GroupTypes.group.value, description="xlsform entry type")
     name: str = Field(..., description="name of the group")
     label: str = Field(..., description="label of the group")
     items: List[Union[Question, "QuestionGroup"]] = Field(
@@ -657,27 +746,37 @@ class QuestionGroup(BaseModel):
         description="number of repeats",
     )
 
-    class Config:
-        """pydantic configuration."""
+    model_config = ConfigDict(coerce_numbers_to_str=True)
 
-        use_enum_values = True
+    @field_validator("type", mode="before")
+    @classmethod
+    def validate_type(cls, v):
+        """Raise ValueError unless type is a valid group type."""
+        return _validate_enum_value(v, GroupTypes, _GROUP_TYPE_LOOKUP, "group type")
 
-    @root_validator(pre=False)
-    def validate_repeat(cls, values):
+    @model_validator(mode="after")
+    def validate_repeat(self) -> "QuestionGroup":
         """Set type to repeat_count or raise ValueError."""
-        group_type = values["type"]
-
-        if not hasattr(GroupTypes, group_type):
-            raise ValueError("Invalid question type")
+        group_type = self.type
 
-        repeat_count = values["repeat_count"]
+        repeat_count = self.repeat_count
         if group_type == "repeat":
             if repeat_count is None:
                 raise ValueError("repeat_count cannot be None when type == 'repeat'")
         else:
             if repeat_count is not None:
-                values["type"] = GroupTypes.repeat
-        return values
+                self.type = GroupTypes.repeat.value
+        return self
+
+    @classmethod
+    def from_trusted(cls, **data) -> "QuestionGroup":
+        """
+        Return QuestionGroup built from already-validated data, skipping validation.
+
+        Only use this for data produced by this library, such as another
+        QuestionGroup's fields. Nested models must already be model instances.
+        """
+        return cls.model_construct(**data)
 
 
 base_appearance_combos = (
@@ -731,10 +830,28 @@ base_appearance_combos = (
     ("spike_full_measure", "image"),
     ("spike_point_to_point", "image"),
 )
-hidden_appearance_combos = tuple(("hidden", type.value) for type in QuestionTypes)
-Appearance_Question_Combos = base_appearance_combos + hidden_appearance_combos
 
 
+def index_appearance_combos(
+    combos: Iterable[Tuple[str, str]],
+) -> Dict[str, FrozenSet[str]]:
+    """Map each question type to the set of appearance attributes valid for it."""
+    # hidden is valid for all question types
+    appearances_by_type: Dict[str, Set[str]] = {
+        type.value: {AppearanceAttributes.hidden.value} for type in QuestionTypes
+    }
+    for appearance_attribute, type in combos:
+        appearances_by_type[type].add(AppearanceAttributes[appearance_attribute].value)
+    return {
+        type: frozenset(appearance_attributes)
+        for type, appearance_attributes in appearances_by_type.items()
+    }
+
+
+APPEARANCE_BY_TYPE = index_appearance_combos(base_appearance_combos)
+
+
+@lru_cache(maxsize=None)
 def check_appearance_question_combo(
     appearance_attribute: str,
     type: str,
@@ -753,1052 +870,1054 @@ def check_appearance_question_combo(
     -------
     True if the combination is valid, False otherwise.
     """
-    return (appearance_attribute, type) in Appearance_Question_Combos
-
-
-RESERVED_NAMES = [
-    "A",
-    "ABS",
-    "ABSENT",
-    "ACCESS",
-    "ACCORDING",
-    "ACCOUNT",
-    "ACTIVATE",
-    "ADA",
-    "ADD",
-    "ADMIN",
-    "ADVISE",
-    "AFTER",
-    "ALL",
-    "ALL_ROWS",
-    "ALLOCATE",
-    "ALLOW",
-    "ALTER",
-    "ANALYSE",
-    "ANALYZE",
-    "AND",
-    "ANY",
-    "ARCHIVE",
-    "ARCHIVELOG",
-    "ARE",
-    "AREA",
-    "ARRAY",
-    "ARRAY_AGG",
-    "ARRAY_MAX_CARDINALITY",
-    "AS",
-    "ASC",
-    "ASENSITIVE",
-    "ASSOCIATE",
-    "ASUTIME",
-    "ASYMMETRIC",
-    "AT",
-    "ATOMIC",
-    "ATTRIBUTES",
-    "AUDIT",
-    "AUTHENTICATED",
-    "AUTHORIZATION",
-    "AUTOEXTEND",
-    "AUTOMATIC",
-    "AUX",
-    "AUXILIARY",
-    "AVG",
-    "BACKUP",
-    "BASE64",
-    "BECOME",
-    "BEFORE",
-    "BEGIN",
-    "BEGIN_FRAME",
-    "BEGIN_PARTITION",
-    "BERNOULLI",
-    "BETWEEN",
-    "BFILE",
-    "BINARY",
-    "BIT_LENGTH",
-    "BITMAP",
-    "BLOB",
-    "BLOCK",
-    "BLOCKED",
-    "BODY",
-    "BOM",
-    "BOTH",
-    "BREADTH",
-    "BREAK",
-    "BROWSE",
-    "BUFFERPOOL",
-    "BULK",
-    "BY",
-    "C",
-    "CACHE",
-    "CACHE_INSTANCES",
-    "CALL",
-    "CANCEL",
-    "CAPTURE",
-    "CARDINALITY",
-    "CASCADE",
-    "CASCADED",
-    "CASE",
-    "CAST",
-    "CATALOG_NAME",
-    "CCSID",
-    "CEIL",
-    "CEILING",
-    "CFILE",
-    "CHAINED",
-    "CHANGE",
-    "CHAR",
-    "CHAR_CS",
-    "CHAR_LENGTH",
-    "CHARACTER",
-    "CHARACTER_LENGTH",
-    "CHARACTER_SET_CATALOG",
-    "CHARACTER_SET_NAME",
-    "CHARACTER_SET_SCHEMA",
-    "CHARACTERS",
-    "CHECK",
-    "CHECKPOINT",
-    "CHOOSE",
-    "CHUNK",
-    "CLASS_ORIGIN",
-    "CLEAR",
-    "CLOB",
-    "CLONE",
-    "CLOSE",
-    "CLOSE_CACHED_OPEN_CURSORS",
-    "CLUSTER",
-    "CLUSTERED",
-    "COALESCE",
-    "COBOL",
-    "COLLATE",
-    "COLLATION",
-    "COLLATION_CATALOG",
-    "COLLATION_NAME",
-    "COLLATION_SCHEMA",
-    "COLLECT",
-    "COLLECTION",
-    "COLLID",
-    "COLUMN",
-    "COLUMN_NAME",
-    "COLUMNS",
-    "COMMAND_FUNCTION",
-    "COMMAND_FUNCTION_CODE",
-    "COMMENT",
-    "COMMIT",
-    "COMMITTED",
-    "COMPATIBILITY",
-    "COMPILE",
-    "COMPLETE",
-    "COMPOSITE_LIMIT",
-    "COMPRESS",
-    "COMPUTE",
-    "CONCAT",
-    "CONCURRENTLY",
-    "CONDITION",
-    "CONDITION_NUMBER",
-    "CONNECT",
-    "CONNECT_TIME",
-    "CONNECTION",
-    "CONNECTION_NAME",
-    "CONSTRAINT",
-    "CONSTRAINT_CATALOG",
-    "CONSTRAINT_NAME",
-    "CONSTRAINT_SCHEMA",
-    "CONSTRAINTS",
-    "CONSTRUCTOR",
-    "CONTAINS",
-    "CONTAINSTABLE",
-    "CONTENT",
-    "CONTENTS",
-    "CONTINUE",
-    "CONTROL",
-    "CONTROLFILE",
-    "CONVERT",
-    "CORR",
-    "CORRESPONDING",
-    "COST",
-    "COUNT",
-    "COVAR_POP",
-    "COVAR_SAMP",
-    "CPU_PER_CALL",
-    "CPU_PER_SESSION",
-    "CREATE",
-    "CREATIONDATE",
-    "CREATOR",
-    "CROSS",
-    "CUBE",
-    "CUME_DIST",
-    "CURREN_USER",
-    "CURRENT",
-    "CURRENT_CATALOG",
-    "CURRENT_CONNECTION",
-    "CURRENT_DATE",
-    "CURRENT_DEFAULT_TRANSFORM_GROUP",
-    "CURRENT_LC_CTYPE",
-    "CURRENT_PATH",
-    "CURRENT_ROLE",
-    "CURRENT_ROW",
-    "CURRENT_SCHEMA",
-    "CURRENT_TIME",
-    "CURRENT_TIMESTAMP",
-    "CURRENT_TRANSFORM_GROUP_FOR_TYPE",
-    "CURRENT_USER",
-    "CURRENT_UTCDATE",
-    "CURRENT_UTCTIME",
-    "CURRENT_UTCTIMESTAMP",
-    "CURRVAL",
-    "CURSOR",
-    "CURSOR_NAME",
-    "CYCLE",
-    "DANGLING",
-    "DATA",
-    "DATABASE",
-    "DATAFILE",
-    "DATAFILES",
-    "DATALINK",
-    "DATAOBJNO",
-    "DATE",
-    "DATETIME_INTERVAL_CODE",
-    "DATETIME_INTERVAL_PRECISION",
-    "DAY",
-    "DAYS",
-    "DB",
-    "DBA",
-    "DBCC",
-    "DBHIGH",
-    "DBINFO",
-    "DBLOW",
-    "DBMAC",
-    "DEALLOCATE",
-    "DEBUG",
-    "DEC",
-    "DECIMAL",
-    "DECLARE",
-    "DEFAULT",
-    "DEFERRABLE",
-    "DEFERRED",
-    "DEFINED",
-    "DEGREE",
-    "DELETE",
-    "DENSE_RANK",
-    "DENY",
-    "DEPTH",
-    "DEREF",
-    "DERIVED",
-    "DESC",
-    "DESCRIBE",
-    "DESCRIPTOR",
-    "DETERMINISTIC",
-    "DIAGNOSTICS",
-    "DIRECTORY",
-    "DISABLE",
-    "DISALLOW",
-    "DISCONNECT",
-    "DISK",
-    "DISMOUNT",
-    "DISPATCH",
-    "DISTINCT",
-    "DISTRIBUTED",
-    "DLNEWCOPY",
-    "DLPREVIOUSCOPY",
-    "DLURLCOMPLETE",
-    "DLURLCOMPLETEONLY",
-    "DLURLCOMPLETEWRITE",
-    "DLURLPATH",
-    "DLURLPATHONLY",
-    "DLURLPATHWRITE",
-    "DLURLSCHEME",
-    "DLURLSERVER",
-    "DLVALUE",
-    "DML",
-    "DO",
-    "DOCUMENT",
-    "DOUBLE",
-    "DROP",
-    "DSSIZE",
-    "DUMP",
-    "DYNAMIC",
-    "DYNAMIC_FUNCTION",
-    "DYNAMIC_FUNCTION_CODE",
-    "EACH",
-    "EDITDATE",
-    "EDITOR",
-    "EDITPROC",
-    "ELEMENT",
-    "ELSE",
-    "ELSEIF",
-    "ELSIF",
-    "EMAXX",
-    "EMAXY",
-    "EMAXZ",
-    "EMINX",
-    "EMINY",
-    "EMINZ",
-    "EMPTY",
-    "ENABLE",
-    "ENCODING",
-    "ENCRYPTION",
-    "END",
-    "END_FRAME",
-    "END_PARTITION",
-    "END-EXEC",
-    "ENDING",
-    "ENFORCE",
-    "ENFORCED",
-    "ENTITY",
-    "ENTRY",
-    "EQUALS",
-    "ERASE",
-    "ERRLVL",
-    "ESCAPE",
-    "EVERY",
-    "EXCEPT",
-    "EXCEPTION",
-    "EXCEPTIONS",
-    "EXCHANGE",
-    "EXCLUDING",
-    "EXCLUSIVE",
-    "EXEC",
-    "EXECUTE",
-    "EXISTS",
-    "EXIT",
-    "EXP",
-    "EXPIRE",
-    "EXPLAIN",
-    "EXPRESSION",
-    "EXTENT",
-    "EXTENTS",
-    "EXTERNAL",
-    "EXTERNALLY",
-    "FAILED_LOGIN_ATTEMPTS",
-    "FALSE",
-    "FAST",
-    "FENCED",
-    "FETCH",
-    "FID",
-    "FIELDPROC",
-    "FILE",
-    "FILLFACTOR",
-    "FILTER",
-    "FINAL",
-    "FIRST",
-    "FIRST_ROWS",
-    "FIRST_VALUE",
-    "FLAG",
-    "FLAGGER",
-    "FLOAT",
-    "FLOB",
-    "FLOOR",
-    "FLUSH",
-    "FOR",
-    "FORCE",
-    "FOREIGN",
-    "FORTRAN",
-    "FOUND",
-    "FRAME_ROW",
-    "FREE",
-    "FREELIST",
-    "FREELISTS",
-    "FREETEXT",
-    "FREETEXTTABLE",
-    "FREEZE",
-    "FROM",
-    "FS",
-    "FULL",
-    "FUNCTION",
-    "FUSION",
-    "G",
-    "GENERAL",
-    "GENERATED",
-    "GET",
-    "GLOBAL",
-    "GLOBAL_NAME",
-    "GLOBALID",
-    "GLOBALLY",
-    "GO",
-    "GOTO",
-    "GRANT",
-    "GROUP",
-    "GROUPING",
-    "GROUPS",
-    "HANDLER",
-    "HASH",
-    "HASHKEYS",
-    "HAVING",
-    "HEADER",
-    "HEAP",
-    "HEX",
-    "HIERARCHY",
-    "HOLD",
-    "HOLDLOCK",
-    "HOUR",
-    "HOURS",
-    "ID",
-    "IDENTIFIED",
-    "IDENTITY",
-    "IDENTITY_INSERT",
-    "IDENTITYCOL",
-    "IDGENERATORS",
-    "IDLE_TIME",
-    "IF",
-    "IGNORE",
-    "ILIKE",
-    "IMMEDIATE",
-    "IMMEDIATELY",
-    "IMPLEMENTATION",
-    "IMPORT",
-    "IN",
-    "INCLUDING",
-    "INCLUSIVE",
-    "INCREMENT",
-    "IND_PARTITION",
-    "INDENT",
-    "INDEX",
-    "INDEXED",
-    "INDEXES",
-    "INDICATOR",
-    "INHERIT",
-    "INITIAL",
-    "INITIALLY",
-    "INITRANS",
-    "INNER",
-    "INOUT",
-    "INSENSITIVE",
-    "INSERT",
-    "INSTANCE",
-    "INSTANCES",
-    "INSTANTIABLE",
-    "INSTEAD",
-    "INT",
-    "INTEGER",
-    "INTEGRITY",
-    "INTERMEDIATE",
-    "INTERSECT",
-    "INTERSECTION",
-    "INTO",
-    "IS",
-    "ISNULL",
-    "ISOBID",
-    "ISOLATION",
-    "ISOLATION_LEVEL",
-    "ITERATE",
-    "JAR",
-    "JOIN",
-    "K",
-    "KEEP",
-    "KEY",
-    "KEY_MEMBER",
-    "KEY_TYPE",
-    "KILL",
-    "LABEL",
-    "LAG",
-    "LANGUAGE",
-    "LAST",
-    "LAST_VALUE",
-    "LATERAL",
-    "LAYER",
-    "LC_CTYPE",
-    "LEAD",
-    "LEADING",
-    "LEAVE",
-    "LEFT",
-    "LEN",
-    "LENGTH",
-    "LESS",
-    "LEVEL",
-    "LIBRARY",
-    "LIKE",
-    "LIKE_REGEX",
-    "LIMIT",
-    "LINENO",
-    "LINK",
-    "LIST",
-    "LN",
-    "LOAD",
-    "LOB",
-    "LOCAL",
-    "LOCALE",
-    "LOCALTIME",
-    "LOCALTIMESTAMP",
-    "LOCATOR",
-    "LOCATORS",
-    "LOCK",
-    "LOCKED",
-    "LOCKMAX",
-    "LOCKSIZE",
-    "LOG",
-    "LOGFILE",
-    "LOGGING",
-    "LOGICAL_READS_PER_CALL",
-    "LOGICAL_READS_PER_SESSION",
-    "LONG",
-    "LOOP",
-    "LOWER",
-    "M",
-    "MAINTAINED",
-    "MANAGE",
-    "MAP",
-    "MASTER",
-    "MATCHED",
-    "MATERIALIZED",
-    "MAX",
-    "MAX_CARDINALITY",
-    "MAX_MEASURE",
-    "MAXARCHLOGS",
-    "MAXDATAFILES",
-    "MAXEXTENTS",
-    "MAXINSTANCES",
-    "MAXLOGFILES",
-    "MAXLOGHISTORY",
-    "MAXLOGMEMBERS",
-    "MAXSIZE",
-    "MAXTRANS",
-    "MAXVALUE",
-    "MEMBER",
-    "MERGE",
-    "MESSAGE_LENGTH",
-    "MESSAGE_OCTET_LENGTH",
-    "MESSAGE_TEXT",
-    "METHOD",
-    "MICROSECOND",
-    "MICROSECONDS",
-    "MIN",
-    "MIN_MEASURE",
-    "MINEXTENTS",
-    "MINIMUM",
-    "MINUS",
-    "MINUTE",
-    "MINUTES",
-    "MINVALUE",
-    "MLS_LABEL_FORMAT",
-    "MLSLABEL",
-    "MOD",
-    "MODE",
-    "MODIFIES",
-    "MODIFY",
-    "MODULE",
-    "MONTH",
-    "MONTHS",
-    "MORE",
-    "MOUNT",
-    "MOVE",
-    "MTS_DISPATCHERS",
-    "MULTISET",
-    "MUMPS",
-    "NAMESPACE",
-    "NATIONAL",
-    "NATURAL",
-    "NCHAR",
-    "NCHAR_CS",
-    "NCLOB",
-    "NEEDED",
-    "NESTED",
-    "NESTING",
-    "NETWORK",
-    "NEW",
-    "NEXT",
-    "NEXTVAL",
-    "NFC",
-    "NFD",
-    "NFKC",
-    "NFKD",
-    "NIL",
-    "NO",
-    "NOARCHIVELOG",
-    "NOAUDIT",
-    "NOCACHE",
-    "NOCHECK",
-    "NOCOMPRESS",
-    "NOCYCLE",
-    "NOFORCE",
-    "NOLOGGING",
-    "NOMAXVALUE",
-    "NOMINVALUE",
-    "NONCLUSTERED",
-    "NONE",
-    "NOORDER",
-    "NOOVERRIDE",
-    "NOPARALLEL",
-    "NOREVERSE",
-    "NORMAL",
-    "NORMALIZE",
-    "NORMALIZED",
-    "NOSORT",
-    "NOT",
-    "NOTHING",
-    "NOTNULL",
-    "NOWAIT",
-    "NTH_VALUE",
-    "NTILE",
-    "NULL",
-    "NULLABLE",
-    "NULLIF",
-    "NULLS",
-    "NUMBER",
-    "NUMERIC",
-    "NUMOFPTS",
-    "NUMPARTS",
-    "NVARCHAR2",
-    "OBID",
-    "OBJECT",
-    "OBJECTID",
-    "OBJNO",
-    "OBJNO_REUSE",
-    "OCCURRENCES_REGEX",
-    "OCTET_LENGTH",
-    "OCTETS",
-    "OF",
-    "OFF",
-    "OFFLINE",
-    "OFFSET",
-    "OFFSETS",
-    "OID",
-    "OIDINDEX",
-    "OLD",
-    "ON",
-    "ONLINE",
-    "ONLY",
-    "OPCODE",
-    "OPEN",
-    "OPENDATASOURCE",
-    "OPENQUERY",
-    "OPENROWSET",
-    "OPENXML",
-    "OPTIMAL",
-    "OPTIMIZATION",
-    "OPTIMIZE",
-    "OPTIMIZER_GOAL",
-    "OPTION",
-    "OR",
-    "ORDER",
-    "ORDERING",
-    "ORDINALITY",
-    "ORGANIZATION",
-    "OSLABEL",
-    "OTHERS",
-    "OUT",
-    "OUTER",
-    "OUTPUT",
-    "OVER",
-    "OVERFLOW",
-    "OVERLAPS",
-    "OVERRIDING",
-    "OWN",
-    "P",
-    "PACKAGE",
-    "PAD",
-    "PADDED",
-    "PARALLEL",
-    "PARAMETER",
-    "PARAMETER_MODE",
-    "PARAMETER_NAME",
-    "PARAMETER_ORDINAL_POSITION",
-    "PARAMETER_SPECIFIC_CATALOG",
-    "PARAMETER_SPECIFIC_NAME",
-    "PARAMETER_SPECIFIC_SCHEMA",
-    "PART",
-    "PARTITION",
-    "PARTITIONED",
-    "PARTITIONING",
-    "PASCAL",
-    "PASSTHROUGH",
-    "PASSWORD",
-    "PASSWORD_GRACE_TIME",
-    "PASSWORD_LIFE_TIME",
-    "PASSWORD_LOCK_TIME",
-    "PASSWORD_REUSE_MAX",
-    "PASSWORD_REUSE_TIME",
-    "PASSWORD_VERIFY_FUNCTION",
-    "PATH",
-    "PCTFREE",
-    "PCTINCREASE",
-    "PCTTHRESHOLD",
-    "PCTUSED",
-    "PCTVERSION",
-    "PERCENT",
-    "PERCENT_RANK",
-    "PERCENTILE_CONT",
-    "PERCENTILE_DISC",
-    "PERIOD",
-    "PERMANENT",
-    "PERMISSION",
-    "PIECESIZE",
-    "PIVOT",
-    "PLACING",
-    "PLAN",
-    "PLI",
-    "PLSQL_DEBUG",
-    "POINTS",
-    "PORTION",
-    "POSITION_REGEX",
-    "POST_TRANSACTION",
-    "POWER",
-    "PRECEDES",
-    "PRECISION",
-    "PREPARE",
-    "PRESERVE",
-    "PREVVAL",
-    "PRIMARY",
-    "PRINT",
-    "PRIOR",
-    "PRIQTY",
-    "PRIVATE",
-    "PRIVATE_SGA",
-    "PRIVILEGE",
-    "PRIVILEGES",
-    "PROC",
-    "PROCEDURE",
-    "PROFILE",
-    "PROGRAM",
-    "PSID",
-    "PUBLIC",
-    "PURGE",
-    "QUERY",
-    "QUERYNO",
-    "QUEUE",
-    "QUOTA",
-    "RAISERROR",
-    "RANGE",
-    "RANK",
-    "RAW",
-    "RBA",
-    "READ",
-    "READS",
-    "READTEXT",
-    "READUP",
-    "REAL",
-    "REBUILD",
-    "RECONFIGURE",
-    "RECOVER",
-    "RECOVERABLE",
-    "RECOVERY",
-    "REF",
-    "REFERENCES",
-    "REFERENCING",
-    "REFRESH",
-    "REGR_AVGX",
-    "REGR_AVGY",
-    "REGR_COUNT",
-    "REGR_INTERCEPT",
-    "REGR_R2",
-    "REGR_SLOPE",
-    "REGR_SXX",
-    "REGR_SXY",
-    "REGR_SYY",
-    "RELEASE",
-    "RENAME",
-    "REPEAT",
-    "REPLACE",
-    "REPLICATION",
-    "REQUIRING",
-    "RESET",
-    "RESETLOGS",
-    "RESIGNAL",
-    "RESIZE",
-    "RESOURCE",
-    "RESPECT",
-    "RESTORE",
-    "RESTRICT",
-    "RESTRICTED",
-    "RESULT",
-    "RESULT_SET_LOCATOR",
-    "RETURN",
-    "RETURNED_CARDINALITY",
-    "RETURNED_LENGTH",
-    "RETURNED_OCTET_LENGTH",
-    "RETURNED_SQLSTATE",
-    "RETURNING",
-    "RETURNS",
-    "REUSE",
-    "REVERSE",
-    "REVERT",
-    "REVOKE",
-    "RIGHT",
-    "ROLE",
-    "ROLES",
-    "ROLLBACK",
-    "ROLLUP",
-    "ROUND_CEILING",
-    "ROUND_DOWN",
-    "ROUND_FLOOR",
-    "ROUND_HALF_DOWN",
-    "ROUND_HALF_EVEN",
-    "ROUND_HALF_UP",
-    "ROUND_UP",
-    "ROUTINE",
-    "ROUTINE_CATALOG",
-    "ROUTINE_NAME",
-    "ROUTINE_SCHEMA",
-    "ROW",
-    "ROW_COUNT",
-    "ROW_NUMBER",
-    "ROWCOUNT",
-    "ROWGUIDCOL",
-    "ROWID",
-    "ROWNUM",
-    "ROWS",
-    "ROWSET",
-    "RULE",
-    "RUN",
-    "SAMPLE",
-    "SAVE",
-    "SAVEPOINT",
-    "SB4",
-    "SCALE",
-    "SCAN_INSTANCES",
-    "SCHEMA",
-    "SCHEMA_NAME",
-    "SCN",
-    "SCOPE",
-    "SCOPE_CATALOG",
-    "SCOPE_NAME",
-    "SCOPE_SCHEMA",
-    "SCRATCHPAD",
-    "SD_ALL",
-    "SD_INHIBIT",
-    "SD_SHOW",
-    "SECOND",
-    "SECONDS",
-    "SECQTY",
-    "SECTION",
-    "SECURITY",
-    "SECURITYAUDIT",
-    "SEG_BLOCK",
-    "SEG_FILE",
-    "SEGMENT",
-    "SELECT",
-    "SELECTIVE",
-    "SELF",
-    "SEMANTICKEYPHRASETABLE",
-    "SEMANTICSIMILARITYDETAILSTABLE",
-    "SEMANTICSIMILARITYTABLE",
-    "SENSITIVE",
-    "SEQUENCE",
-    "SERIALIZABLE",
-    "SERVER_NAME",
-    "SESSION",
-    "SESSION_CACHED_CURSORS",
-    "SESSION_USER",
-    "SESSIONS_PER_USER",
-    "SET",
-    "SETS",
-    "SETUSER",
-    "SHAPE",
-    "SHARE",
-    "SHARED",
-    "SHARED_POOL",
-    "SHRINK",
-    "SHUTDOWN",
-    "SIGNAL",
-    "SIMILAR",
-    "SIMPLE",
-    "SIZE",
-    "SKIP",
-    "SKIP_UNUSABLE_INDEXES",
-    "SMALLINT",
-    "SNAPSHOT",
-    "SOME",
-    "SORT",
-    "SOURCE",
-    "SPACE",
-    "SPECIFIC",
-    "SPECIFIC_NAME",
-    "SPECIFICATION",
-    "SPECIFICTYPE",
-    "SPLIT",
-    "SQL",
-    "SQL_TRACE",
-    "SQLCODE",
-    "SQLERROR",
-    "SQLEXCEPTION",
-    "SQLSTATE",
-    "SQLWARNING",
-    "SQRT",
-    "STANDARD",
-    "STANDBY",
-    "START",
-    "STATE",
-    "STATEMENT",
-    "STATEMENT_ID",
-    "STATIC",
-    "STATISTICS",
-    "STAY",
-    "STDDEV_POP",
-    "STDDEV_SAMP",
-    "STOGROUP",
-    "STOP",
-    "STORAGE",
-    "STORE",
-    "STORES",
-    "STRUCTURE",
-    "STYLE",
-    "SUBCLASS_ORIGIN",
-    "SUBMULTISET",
-    "SUBSTRING_REGEX",
-    "SUCCEEDS",
-    "SUCCESSFUL",
-    "SUM",
-    "SUMMARY",
-    "SWITCH",
-    "SYMMETRIC",
-    "SYNONYM",
-    "SYS_OP_ENFORCE_NOT_NULL$",
-    "SYS_OP_NTCIMG$",
-    "SYSDATE",
-    "SYSDBA",
-    "SYSOPER",
-    "SYSTEM",
-    "SYSTEM_TIME",
-    "SYSTEM_USER",
-    "SYSTIME",
-    "SYSTIMESTAMP",
-    "SYSUUID",
-    "T",
-    "TABLE",
-    "TABLE_NAME",
-    "TABLES",
-    "TABLESAMPLE",
-    "TABLESPACE",
-    "TABLESPACE_NO",
-    "TABNO",
-    "TEMPORARY",
-    "TEXTSIZE",
-    "THAN",
-    "THE",
-    "THEN",
-    "THREAD",
-    "TIES",
-    "TIME",
-    "TIMESTAMP",
-    "TIMEZONE_HOUR",
-    "TIMEZONE_MINUTE",
-    "TO",
-    "TOKEN",
-    "TOP",
-    "TOP_LEVEL_COUNT",
-    "TOPLEVEL",
-    "TRACE",
-    "TRACING",
-    "TRAILING",
-    "TRAN",
-    "TRANSACTION",
-    "TRANSACTION_ACTIVE",
-    "TRANSACTIONS_COMMITTED",
-    "TRANSACTIONS_ROLLED_BACK",
-    "TRANSFORM",
-    "TRANSFORMS",
-    "TRANSITIONAL",
-    "TRANSLATE",
-    "TRANSLATE_REGEX",
-    "TRANSLATION",
-    "TRIGGER",
-    "TRIGGER_CATALOG",
-    "TRIGGER_NAME",
-    "TRIGGER_SCHEMA",
-    "TRIGGERS",
-    "TRIM_ARRAY",
-    "TRUE",
-    "TRUNCATE",
-    "TRY_CONVERT",
-    "TSEQUAL",
-    "TX",
-    "TYPE",
-    "UB2",
-    "UBA",
-    "UESCAPE",
-    "UID",
-    "UNARCHIVED",
-    "UNDER",
-    "UNDO",
-    "UNION",
-    "UNIQUE",
-    "UNLIMITED",
-    "UNLINK",
-    "UNLOCK",
-    "UNNAMED",
-    "UNNEST",
-    "UNPIVOT",
-    "UNRECOVERABLE",
-    "UNTIL",
-    "UNTYPED",
-    "UNUSABLE",
-    "UNUSED",
-    "UPDATABLE",
-    "UPDATE",
-    "UPDATETEXT",
-    "UPPER",
-    "URI",
-    "USAGE",
-    "USE",
-    "USER",
-    "USER_DEFINED_TYPE_CATALOG",
-    "USER_DEFINED_TYPE_CODE",
-    "USER_DEFINED_TYPE_NAME",
-    "USER_DEFINED_TYPE_SCHEMA",
-    "USING",
-    "UTCDATE",
-    "UTCTIME",
-    "UTCTIMESTAMP",
-    "VALIDATE",
-    "VALIDATION",
-    "VALIDPROC",
-    "VALUE",
-    "VALUE_OF",
-    "VALUES",
-    "VAR_POP",
-    "VAR_SAMP",
-    "VARBINARY",
-    "VARCHAR",
-    "VARCHAR2",
-    "VARIABLE",
-    "VARIADIC",
-    "VARIANT",
-    "VARYING",
-    "VCAT",
-    "VERBOSE",
-    "VERSIONING",
-    "VIEW",
-    "VOLATILE",
-    "VOLUMES",
-    "WAITFOR",
-    "WHEN",
-    "WHENEVER",
-    "WHERE",
-    "WHILE",
-    "WIDTH_BUCKET",
-    "WINDOW",
-    "WITH",
-    "WITHIN",
-    "WITHIN GROUP",
-    "WITHOUT",
-    "WLM",
-    "WORK",
-    "WRITE",
-    "WRITEDOWN",
-    "WRITETEXT",
-    "WRITEUP",
-    "XID",
-    "XMLAGG",
-    "XMLBINARY",
-    "XMLCAST",
-    "XMLCOMMENT",
-    "XMLDECLARATION",
-    "XMLDOCUMENT",
-    "XMLEXISTS",
-    "XMLITERATE",
-    "XMLNAMESPACES",
-    "XMLQUERY",
-    "XMLSCHEMA",
-    "XMLTABLE",
-    "XMLTEXT",
-    "XMLVALIDATE",
-    "YEAR",
-    "YEARS",
-    "ZONE",
-]
+    return appearance_attribute in APPEARANCE_BY_TYPE.get(type, ())
+
+
+RESERVED_NAMES = frozenset(
+    {
+        "A",
+        "ABS",
+        "ABSENT",
+        "ACCESS",
+        "ACCORDING",
+        "ACCOUNT",
+        "ACTIVATE",
+        "ADA",
+        "ADD",
+        "ADMIN",
+        "ADVISE",
+        "AFTER",
+        "ALL",
+        "ALL_ROWS",
+        "ALLOCATE",
+        "ALLOW",
+        "ALTER",
+        "ANALYSE",
+        "ANALYZE",
+        "AND",
+        "ANY",
+        "ARCHIVE",
+        "ARCHIVELOG",
+        "ARE",
+        "AREA",
+        "ARRAY",
+        "ARRAY_AGG",
+        "ARRAY_MAX_CARDINALITY",
+        "AS",
+        "ASC",
+        "ASENSITIVE",
+        "ASSOCIATE",
+        "ASUTIME",
+        "ASYMMETRIC",
+        "AT",
+        "ATOMIC",
+        "ATTRIBUTES",
+        "AUDIT",
+        "AUTHENTICATED",
+        "AUTHORIZATION",
+        "AUTOEXTEND",
+        "AUTOMATIC",
+        "AUX",
+        "AUXILIARY",
+        "AVG",
+        "BACKUP",
+        "BASE64",
+        "BECOME",
+        "BEFORE",
+        "BEGIN",
+        "BEGIN_FRAME",
+        "BEGIN_PARTITION",
+        "BERNOULLI",
+        "BETWEEN",
+        "BFILE",
+        "BINARY",
+        "BIT_LENGTH",
+        "BITMAP",
+        "BLOB",
+        "BLOCK",
+        "BLOCKED",
+        "BODY",
+        "BOM",
+        "BOTH",
+        "BREADTH",
+        "BREAK",
+        "BROWSE",
+        "BUFFERPOOL",
+        "BULK",
+        "BY",
+        "C",
+        "CACHE",
+        "CACHE_INSTANCES",
+        "CALL",
+        "CANCEL",
+        "CAPTURE",
+        "CARDINALITY",
+        "CASCADE",
+        "CASCADED",
+        "CASE",
+        "CAST",
+        "CATALOG_NAME",
+        "CCSID",
+        "CEIL",
+        "CEILING",
+        "CFILE",
+        "CHAINED",
+        "CHANGE",
+        "CHAR",
+        "CHAR_CS",
+        "CHAR_LENGTH",
+        "CHARACTER",
+        "CHARACTER_LENGTH",
+        "CHARACTER_SET_CATALOG",
+        "CHARACTER_SET_NAME",
+        "CHARACTER_SET_SCHEMA",
+        "CHARACTERS",
+        "CHECK",
+        "CHECKPOINT",
+        "CHOOSE",
+        "CHUNK",
+        "CLASS_ORIGIN",
+        "CLEAR",
+        "CLOB",
+        "CLONE",
+        "CLOSE",
+        "CLOSE_CACHED_OPEN_CURSORS",
+        "CLUSTER",
+        "CLUSTERED",
+        "COALESCE",
+        "COBOL",
+        "COLLATE",
+        "COLLATION",
+        "COLLATION_CATALOG",
+        "COLLATION_NAME",
+        "COLLATION_SCHEMA",
+        "COLLECT",
+        "COLLECTION",
+        "COLLID",
+        "COLUMN",
+        "COLUMN_NAME",
+        "COLUMNS",
+        "COMMAND_FUNCTION",
+        "COMMAND_FUNCTION_CODE",
+        "COMMENT",
+        "COMMIT",
+        "COMMITTED",
+        "COMPATIBILITY",
+        "COMPILE",
+        "COMPLETE",
+        "COMPOSITE_LIMIT",
+        "COMPRESS",
+        "COMPUTE",
+        "CONCAT",
+        "CONCURRENTLY",
+        "CONDITION",
+        "CONDITION_NUMBER",
+        "CONNECT",
+        "CONNECT_TIME",
+        "CONNECTION",
+        "CONNECTION_NAME",
+        "CONSTRAINT",
+        "CONSTRAINT_CATALOG",
+        "CONSTRAINT_NAME",
+        "CONSTRAINT_SCHEMA",
+        "CONSTRAINTS",
+        "CONSTRUCTOR",
+        "CONTAINS",
+        "CONTAINSTABLE",
+        "CONTENT",
+        "CONTENTS",
+        "CONTINUE",
+        "CONTROL",
+        "CONTROLFILE",
+        "CONVERT",
+        "CORR",
+        "CORRESPONDING",
+        "COST",
+        "COUNT",
+        "COVAR_POP",
+        "COVAR_SAMP",
+        "CPU_PER_CALL",
+        "CPU_PER_SESSION",
+        "CREATE",
+        "CREATIONDATE",
+        "CREATOR",
+        "CROSS",
+        "CUBE",
+        "CUME_DIST",
+        "CURREN_USER",
+        "CURRENT",
+        "CURRENT_CATALOG",
+        "CURRENT_CONNECTION",
+        "CURRENT_DATE",
+        "CURRENT_DEFAULT_TRANSFORM_GROUP",
+        "CURRENT_LC_CTYPE",
+        "CURRENT_PATH",
+        "CURRENT_ROLE",
+        "CURRENT_ROW",
+        "CURRENT_SCHEMA",
+        "CURRENT_TIME",
+        "CURRENT_TIMESTAMP",
+        "CURRENT_TRANSFORM_GROUP_FOR_TYPE",
+        "CURRENT_USER",
+        "CURRENT_UTCDATE",
+        "CURRENT_UTCTIME",
+        "CURRENT_UTCTIMESTAMP",
+        "CURRVAL",
+        "CURSOR",
+        "CURSOR_NAME",
+        "CYCLE",
+        "DANGLING",
+        "DATA",
+        "DATABASE",
+        "DATAFILE",
+        "DATAFILES",
+        "DATALINK",
+        "DATAOBJNO",
+        "DATE",
+        "DATETIME_INTERVAL_CODE",
+        "DATETIME_INTERVAL_PRECISION",
+        "DAY",
+        "DAYS",
+        "DB",
+        "DBA",
+        "DBCC",
+        "DBHIGH",
+        "DBINFO",
+        "DBLOW",
+        "DBMAC",
+        "DEALLOCATE",
+        "DEBUG",
+        "DEC",
+        "DECIMAL",
+        "DECLARE",
+        "DEFAULT",
+        "DEFERRABLE",
+        "DEFERRED",
+        "DEFINED",
+        "DEGREE",
+        "DELETE",
+        "DENSE_RANK",
+        "DENY",
+        "DEPTH",
+        "DEREF",
+        "DERIVED",
+        "DESC",
+        "DESCRIBE",
+        "DESCRIPTOR",
+        "DETERMINISTIC",
+        "DIAGNOSTICS",
+        "DIRECTORY",
+        "DISABLE",
+        "DISALLOW",
+        "DISCONNECT",
+        "DISK",
+        "DISMOUNT",
+        "DISPATCH",
+        "DISTINCT",
+        "DISTRIBUTED",
+        "DLNEWCOPY",
+        "DLPREVIOUSCOPY",
+        "DLURLCOMPLETE",
+        "DLURLCOMPLETEONLY",
+        "DLURLCOMPLETEWRITE",
+        "DLURLPATH",
+        "DLURLPATHONLY",
+        "DLURLPATHWRITE",
+        "DLURLSCHEME",
+        "DLURLSERVER",
+        "DLVALUE",
+        "DML",
+        "DO",
+        "DOCUMENT",
+        "DOUBLE",
+        "DROP",
+        "DSSIZE",
+        "DUMP",
+        "DYNAMIC",
+        "DYNAMIC_FUNCTION",
+        "DYNAMIC_FUNCTION_CODE",
+        "EACH",
+        "EDITDATE",
+        "EDITOR",
+        "EDITPROC",
+        "ELEMENT",
+        "ELSE",
+        "ELSEIF",
+        "ELSIF",
+        "EMAXX",
+        "EMAXY",
+        "EMAXZ",
+        "EMINX",
+        "EMINY",
+        "EMINZ",
+        "EMPTY",
+        "ENABLE",
+        "ENCODING",
+        "ENCRYPTION",
+        "END",
+        "END_FRAME",
+        "END_PARTITION",
+        "END-EXEC",
+        "ENDING",
+        "ENFORCE",
+        "ENFORCED",
+        "ENTITY",
+        "ENTRY",
+        "EQUALS",
+        "ERASE",
+        "ERRLVL",
+        "ESCAPE",
+        "EVERY",
+        "EXCEPT",
+        "EXCEPTION",
+        "EXCEPTIONS",
+        "EXCHANGE",
+        "EXCLUDING",
+        "EXCLUSIVE",
+        "EXEC",
+        "EXECUTE",
+        "EXISTS",
+        "EXIT",
+        "EXP",
+        "EXPIRE",
+        "EXPLAIN",
+        "EXPRESSION",
+        "EXTENT",
+        "EXTENTS",
+        "EXTERNAL",
+        "EXTERNALLY",
+        "FAILED_LOGIN_ATTEMPTS",
+        "FALSE",
+        "FAST",
+        "FENCED",
+        "FETCH",
+        "FID",
+        "FIELDPROC",
+        "FILE",
+        "FILLFACTOR",
+        "FILTER",
+        "FINAL",
+        "FIRST",
+        "FIRST_ROWS",
+        "FIRST_VALUE",
+        "FLAG",
+        "FLAGGER",
+        "FLOAT",
+        "FLOB",
+        "FLOOR",
+        "FLUSH",
+        "FOR",
+        "FORCE",
+        "FOREIGN",
+        "FORTRAN",
+        "FOUND",
+        "FRAME_ROW",
+        "FREE",
+        "FREELIST",
+        "FREELISTS",
+        "FREETEXT",
+        "FREETEXTTABLE",
+        "FREEZE",
+        "FROM",
+        "FS",
+        "FULL",
+        "FUNCTION",
+        "FUSION",
+        "G",
+        "GENERAL",
+        "GENERATED",
+        "GET",
+        "GLOBAL",
+        "GLOBAL_NAME",
+        "GLOBALID",
+        "GLOBALLY",
+        "GO",
+        "GOTO",
+        "GRANT",
+        "GROUP",
+        "GROUPING",
+        "GROUPS",
+        "HANDLER",
+        "HASH",
+        "HASHKEYS",
+        "HAVING",
+        "HEADER",
+        "HEAP",
+        "HEX",
+        "HIERARCHY",
+        "HOLD",
+        "HOLDLOCK",
+        "HOUR",
+        "HOURS",
+        "ID",
+        "IDENTIFIED",
+        "IDENTITY",
+        "IDENTITY_INSERT",
+        "IDENTITYCOL",
+        "IDGENERATORS",
+        "IDLE_TIME",
+        "IF",
+        "IGNORE",
+        "ILIKE",
+        "IMMEDIATE",
+        "IMMEDIATELY",
+        "IMPLEMENTATION",
+        "IMPORT",
+        "IN",
+        "INCLUDING",
+        "INCLUSIVE",
+        "INCREMENT",
+        "IND_PARTITION",
+        "INDENT",
+        "INDEX",
+        "INDEXED",
+        "INDEXES",
+        "INDICATOR",
+        "INHERIT",
+        "INITIAL",
+        "INITIALLY",
+        "INITRANS",
+        "INNER",
+        "INOUT",
+        "INSENSITIVE",
+        "INSERT",
+        "INSTANCE",
+        "INSTANCES",
+        "INSTANTIABLE",
+        "INSTEAD",
+        "INT",
+        "INTEGER",
+        "INTEGRITY",
+        "INTERMEDIATE",
+        "INTERSECT",
+        "INTERSECTION",
+        "INTO",
+        "IS",
+        "ISNULL",
+        "ISOBID",
+        "ISOLATION",
+        "ISOLATION_LEVEL",
+        "ITERATE",
+        "JAR",
+        "JOIN",
+        "K",
+        "KEEP",
+        "KEY",
+        "KEY_MEMBER",
+        "KEY_TYPE",
+        "KILL",
+        "LABEL",
+        "LAG",
+        "LANGUAGE",
+        "LAST",
+        "LAST_VALUE",
+        "LATERAL",
+        "LAYER",
+        "LC_CTYPE",
+        "LEAD",
+        "LEADING",
+        "LEAVE",
+        "LEFT",
+        "LEN",
+        "LENGTH",
+        "LESS",
+        "LEVEL",
+        "LIBRARY",
+        "LIKE",
+        "LIKE_REGEX",
+        "LIMIT",
+        "LINENO",
+        "LINK",
+        "LIST",
+        "LN",
+        "LOAD",
+        "LOB",
+        "LOCAL",
+        "LOCALE",
+        "LOCALTIME",
+        "LOCALTIMESTAMP",
+        "LOCATOR",
+        "LOCATORS",
+        "LOCK",
+        "LOCKED",
+        "LOCKMAX",
+        "LOCKSIZE",
+        "LOG",
+        "LOGFILE",
+        "LOGGING",
+        "LOGICAL_READS_PER_CALL",
+        "LOGICAL_READS_PER_SESSION",
+        "LONG",
+        "LOOP",
+        "LOWER",
+        "M",
+        "MAINTAINED",
+        "MANAGE",
+        "MAP",
+        "MASTER",
+        "MATCHED",
+        "MATERIALIZED",
+        "MAX",
+        "MAX_CARDINALITY",
+        "MAX_MEASURE",
+        "MAXARCHLOGS",
+        "MAXDATAFILES",
+        "MAXEXTENTS",
+        "MAXINSTANCES",
+        "MAXLOGFILES",
+        "MAXLOGHISTORY",
+        "MAXLOGMEMBERS",
+        "MAXSIZE",
+        "MAXTRANS",
+        "MAXVALUE",
+        "MEMBER",
+        "MERGE",
+        "MESSAGE_LENGTH",
+        "MESSAGE_OCTET_LENGTH",
+        "MESSAGE_TEXT",
+        "METHOD",
+        "MICROSECOND",
+        "MICROSECONDS",
+        "MIN",
+        "MIN_MEASURE",
+        "MINEXTENTS",
+        "MINIMUM",
+        "MINUS",
+        "MINUTE",
+        "MINUTES",
+        "MINVALUE",
+        "MLS_LABEL_FORMAT",
+        "MLSLABEL",
+        "MOD",
+        "MODE",
+        "MODIFIES",
+        "MODIFY",
+        "MODULE",
+        "MONTH",
+        "MONTHS",
+        "MORE",
+        "MOUNT",
+        "MOVE",
+        "MTS_DISPATCHERS",
+        "MULTISET",
+        "MUMPS",
+        "NAMESPACE",
+        "NATIONAL",
+        "NATURAL",
+        "NCHAR",
+        "NCHAR_CS",
+        "NCLOB",
+        "NEEDED",
+        "NESTED",
+        "NESTING",
+        "NETWORK",
+        "NEW",
+        "NEXT",
+        "NEXTVAL",
+        "NFC",
+        "NFD",
+        "NFKC",
+        "NFKD",
+        "NIL",
+        "NO",
+        "NOARCHIVELOG",
+        "NOAUDIT",
+        "NOCACHE",
+        "NOCHECK",
+        "NOCOMPRESS",
+        "NOCYCLE",
+        "NOFORCE",
+        "NOLOGGING",
+        "NOMAXVALUE",
+        "NOMINVALUE",
+        "NONCLUSTERED",
+        "NONE",
+        "NOORDER",
+        "NOOVERRIDE",
+        "NOPARALLEL",
+        "NOREVERSE",
+        "NORMAL",
+        "NORMALIZE",
+        "NORMALIZED",
+        "NOSORT",
+        "NOT",
+        "NOTHING",
+        "NOTNULL",
+        "NOWAIT",
+        "NTH_VALUE",
+        "NTILE",
+        "NULL",
+        "NULLABLE",
+        "NULLIF",
+        "NULLS",
+        "NUMBER",
+        "NUMERIC",
+        "NUMOFPTS",
+        "NUMPARTS",
+        "NVARCHAR2",
+        "OBID",
+        "OBJECT",
+        "OBJECTID",
+        "OBJNO",
+        "OBJNO_REUSE",
+        "OCCURRENCES_REGEX",
+        "OCTET_LENGTH",
+        "OCTETS",
+        "OF",
+        "OFF",
+        "OFFLINE",
+        "OFFSET",
+        "OFFSETS",
+        "OID",
+        "OIDINDEX",
+        "OLD",
+        "ON",
+        "ONLINE",
+        "ONLY",
+        "OPCODE",
+        "OPEN",
+        "OPENDATASOURCE",
+        "OPENQUERY",
+        "OPENROWSET",
+        "OPENXML",
+        "OPTIMAL",
+        "OPTIMIZATION",
+        "OPTIMIZE",
+        "OPTIMIZER_GOAL",
+        "OPTION",
+        "OR",
+        "ORDER",
+        "ORDERING",
+        "ORDINALITY",
+        "ORGANIZATION",
+        "OSLABEL",
+        "OTHERS",
+        "OUT",
+        "OUTER",
+        "OUTPUT",
+        "OVER",
+        "OVERFLOW",
+        "OVERLAPS",
+        "OVERRIDING",
+        "OWN",
+        "P",
+        "PACKAGE",
+        "PAD",
+        "PADDED",
+        "PARALLEL",
+        "PARAMETER",
+        "PARAMETER_MODE",
+        "PARAMETER_NAME",
+        "PARAMETER_ORDINAL_POSITION",
+        "PARAMETER_SPECIFIC_CATALOG",
+        "PARAMETER_SPECIFIC_NAME",
+        "PARAMETER_SPECIFIC_SCHEMA",
+        "PART",
+        "PARTITION",
+        "PARTITIONED",
+        "PARTITIONING",
+        "PASCAL",
+        "PASSTHROUGH",
+        "PASSWORD",
+        "PASSWORD_GRACE_TIME",
+        "PASSWORD_LIFE_TIME",
+        "PASSWORD_LOCK_TIME",
+        "PASSWORD_REUSE_MAX",
+        "PASSWORD_REUSE_TIME",
+        "PASSWORD_VERIFY_FUNCTION",
+        "PATH",
+        "PCTFREE",
+        "PCTINCREASE",
+        "PCTTHRESHOLD",
+        "PCTUSED",
+        "PCTVERSION",
+        "PERCENT",
+        "PERCENT_RANK",
+        "PERCENTILE_CONT",
+        "PERCENTILE_DISC",
+        "PERIOD",
+        "PERMANENT",
+        "PERMISSION",
+        "PIECESIZE",
+        "PIVOT",
+        "PLACING",
+        "PLAN",
+        "PLI",
+        "PLSQL_DEBUG",
+        "POINTS",
+        "PORTION",
+        "POSITION_REGEX",
+        "POST_TRANSACTION",
+        "POWER",
+        "PRECEDES",
+        "PRECISION",
+        "PREPARE",
+        "PRESERVE",
+        "PREVVAL",
+        "PRIMARY",
+        "PRINT",
+        "PRIOR",
+        "PRIQTY",
+        "PRIVATE",
+        "PRIVATE_SGA",
+        "PRIVILEGE",
+        "PRIVILEGES",
+        "PROC",
+        "PROCEDURE",
+        "PROFILE",
+        "PROGRAM",
+        "PSID",
+        "PUBLIC",
+        "PURGE",
+        "QUERY",
+        "QUERYNO",
+        "QUEUE",
+        "QUOTA",
+        "RAISERROR",
+        "RANGE",
+        "RANK",
+        "RAW",
+        "RBA",
+        "READ",
+        "READS",
+        "READTEXT",
+        "READUP",
+        "REAL",
+        "REBUILD",
+        "RECONFIGURE",
+        "RECOVER",
+        "RECOVERABLE",
+        "RECOVERY",
+        "REF",
+        "REFERENCES",
+        "REFERENCING",
+        "REFRESH",
+        "REGR_AVGX",
+        "REGR_AVGY",
+        "REGR_COUNT",
+        "REGR_INTERCEPT",
+        "REGR_R2",
+        "REGR_SLOPE",
+        "REGR_SXX",
+        "REGR_SXY",
+        "REGR_SYY",
+        "RELEASE",
+        "RENAME",
+        "REPEAT",
+        "REPLACE",
+        "REPLICATION",
+        "REQUIRING",
+        "RESET",
+        "RESETLOGS",
+        "RESIGNAL",
+        "RESIZE",
+        "RESOURCE",
+        "RESPECT",
+        "RESTORE",
+        "RESTRICT",
+        "RESTRICTED",
+        "RESULT",
+        "RESULT_SET_LOCATOR",
+        "RETURN",
+        "RETURNED_CARDINALITY",
+        "RETURNED_LENGTH",
+        "RETURNED_OCTET_LENGTH",
+        "RETURNED_SQLSTATE",
+        "RETURNING",
+        "RETURNS",
+        "REUSE",
+        "REVERSE",
+        "REVERT",
+        "REVOKE",
+        "RIGHT",
+        "ROLE",
+        "ROLES",
+        "ROLLBACK",
+        "ROLLUP",
+        "ROUND_CEILING",
+        "ROUND_DOWN",
+        "ROUND_FLOOR",
+        "ROUND_HALF_DOWN",
+        "ROUND_HALF_EVEN",
+        "ROUND_HALF_UP",
+        "ROUND_UP",
+        "ROUTINE",
+        "ROUTINE_CATALOG",
+        "ROUTINE_NAME",
+        "ROUTINE_SCHEMA",
+        "ROW",
+        "ROW_COUNT",
+        "ROW_NUMBER",
+        "ROWCOUNT",
+        "ROWGUIDCOL",
+        "ROWID",
+        "ROWNUM",
+        "ROWS",
+        "ROWSET",
+        "RULE",
+        "RUN",
+        "SAMPLE",
+        "SAVE",
+        "SAVEPOINT",
+        "SB4",
+        "SCALE",
+        "SCAN_INSTANCES",
+        "SCHEMA",
+        "SCHEMA_NAME",
+        "SCN",
+        "SCOPE",
+        "SCOPE_CATALOG",
+        "SCOPE_NAME",
+        "SCOPE_SCHEMA",
+        "SCRATCHPAD",
+        "SD_ALL",
+        "SD_INHIBIT",
+        "SD_SHOW",
+        "SECOND",
+        "SECONDS",
+        "SECQTY",
+        "SECTION",
+        "SECURITY",
+        "SECURITYAUDIT",
+        "SEG_BLOCK",
+        "SEG_FILE",
+        "SEGMENT",
+        "SELECT",
+        "SELECTIVE",
+        "SELF",
+        "SEMANTICKEYPHRASETABLE",
+        "SEMANTICSIMILARITYDETAILSTABLE",
+        "SEMANTICSIMILARITYTABLE",
+        "SENSITIVE",
+        "SEQUENCE",
+        "SERIALIZABLE",
+        "SERVER_NAME",
+        "SESSION",
+        "SESSION_CACHED_CURSORS",
+        "SESSION_USER",
+        "SESSIONS_PER_USER",
+        "SET",
+        "SETS",
+        "SETUSER",
+        "SHAPE",
+        "SHARE",
+        "SHARED",
+        "SHARED_POOL",
+        "SHRINK",
+        "SHUTDOWN",
+        "SIGNAL",
+        "SIMILAR",
+        "SIMPLE",
+        "SIZE",
+        "SKIP",
+        "SKIP_UNUSABLE_INDEXES",
+        "SMALLINT",
+        "SNAPSHOT",
+        "SOME",
+        "SORT",
+        "SOURCE",
+        "SPACE",
+        "SPECIFIC",
+        "SPECIFIC_NAME",
+        "SPECIFICATION",
+        "SPECIFICTYPE",
+        "SPLIT",
+        "SQL",
+        "SQL_TRACE",
+        "SQLCODE",
+        "SQLERROR",
+        "SQLEXCEPTION",
+        "SQLSTATE",
+        "SQLWARNING",
+        "SQRT",
+        "STANDARD",
+        "STANDBY",
+        "START",
+        "STATE",
+        "STATEMENT",
+        "STATEMENT_ID",
+        "STATIC",
+        "STATISTICS",
+        "STAY",
+        "STDDEV_POP",
+        "STDDEV_SAMP",
+        "STOGROUP",
+        "STOP",
+        "STORAGE",
+        "STORE",
+        "STORES",
+        "STRUCTURE",
+        "STYLE",
+        "SUBCLASS_ORIGIN",
+        "SUBMULTISET",
+        "SUBSTRING_REGEX",
+        "SUCCEEDS",
+        "SUCCESSFUL",
+        "SUM",
+        "SUMMARY",
+        "SWITCH",
+        "SYMMETRIC",
+        "SYNONYM",
+        "SYS_OP_ENFORCE_NOT_NULL$",
+        "SYS_OP_NTCIMG$",
+        "SYSDATE",
+        "SYSDBA",
+        "SYSOPER",
+        "SYSTEM",
+        "SYSTEM_TIME",
+        "SYSTEM_USER",
+        "SYSTIME",
+        "SYSTIMESTAMP",
+        "SYSUUID",
+        "T",
+        "TABLE",
+        "TABLE_NAME",
+        "TABLES",
+        "TABLESAMPLE",
+        "TABLESPACE",
+        "TABLESPACE_NO",
+        "TABNO",
+        "TEMPORARY",
+        "TEXTSIZE",
+        "THAN",
+        "THE",
+        "THEN",
+        "THREAD",
+        "TIES",
+        "TIME",
+        "TIMESTAMP",
+        "TIMEZONE_HOUR",
+        "TIMEZONE_MINUTE",
+        "TO",
+        "TOKEN",
+        "TOP",
+        "TOP_LEVEL_COUNT",
+        "TOPLEVEL",
+        "TRACE",
+        "TRACING",
+        "TRAILING",
+        "TRAN",
+        "TRANSACTION",
+        "TRANSACTION_ACTIVE",
+        "TRANSACTIONS_COMMITTED",
+        "TRANSACTIONS_ROLLED_BACK",
+        "TRANSFORM",
+        "TRANSFORMS",
+        "TRANSITIONAL",
+        "TRANSLATE",
+        "TRANSLATE_REGEX",
+        "TRANSLATION",
+        "TRIGGER",
+        "TRIGGER_CATALOG",
+        "TRIGGER_NAME",
+        "TRIGGER_SCHEMA",
+        "TRIGGERS",
+        "TRIM_ARRAY",
+        "TRUE",
+        "TRUNCATE",
+        "TRY_CONVERT",
+        "TSEQUAL",
+        "TX",
+        "TYPE",
+        "UB2",
+        "UBA",
+        "UESCAPE",
+        "UID",
+        "UNARCHIVED",
+        "UNDER",
+        "UNDO",
+        "UNION",
+        "UNIQUE",
+        "UNLIMITED",
+        "UNLINK",
+        "UNLOCK",
+        "UNNAMED",
+        "UNNEST",
+        "UNPIVOT",
+        "UNRECOVERABLE",
+        "UNTIL",
+        "UNTYPED",
+        "UNUSABLE",
+        "UNUSED",
+        "UPDATABLE",
+        "UPDATE",
+        "UPDATETEXT",
+        "UPPER",
+        "URI",
+        "USAGE",
+        "USE",
+        "USER",
+        "USER_DEFINED_TYPE_CATALOG",
+        "USER_DEFINED_TYPE_CODE",
+        "USER_DEFINED_TYPE_NAME",
+        "USER_DEFINED_TYPE_SCHEMA",
+        "USING",
+        "UTCDATE",
+        "UTCTIME",
+        "UTCTIMESTAMP",
+        "VALIDATE",
+        "VALIDATION",
+        "VALIDPROC",
+        "VALUE",
+        "VALUE_OF",
+        "VALUES",
+        "VAR_POP",
+        "VAR_SAMP",
+        "VARBINARY",
+        "VARCHAR",
+        "VARCHAR2",
+        "VARIABLE",
+        "VARIADIC",
+        "VARIANT",
+        "VARYING",
+        "VCAT",
+        "VERBOSE",
+        "VERSIONING",
+        "VIEW",
+        "VOLATILE",
+        "VOLUMES",
+        "WAITFOR",
+        "WHEN",
+        "WHENEVER",
+        "WHERE",
+        "WHILE",
+        "WIDTH_BUCKET",
+        "WINDOW",
+        "WITH",
+        "WITHIN",
+        "WITHIN GROUP",
+        "WITHOUT",
+        "WLM",
+        "WORK",
+        "WRITE",
+        "WRITEDOWN",
+        "WRITETEXT",
+        "WRITEUP",
+        "XID",
+        "XMLAGG",
+        "XMLBINARY",
+        "XMLCAST",
+        "XMLCOMMENT",
+        "XMLDECLARATION",
+        "XMLDOCUMENT",
+        "XMLEXISTS",
+        "XMLITERATE",
+        "XMLNAMESPACES",
+        "XMLQUERY",
+        "XMLSCHEMA",
+        "XMLTABLE",
+        "XMLTEXT",
+        "XMLVALIDATE",
+        "YEAR",
+        "YEARS",
+        "ZONE",
+    },
+)
 
 
 def items_to_dfs(
     items: List[Union[QuestionGroup, Question]],
-) -> Dict[str, pd.DataFrame]:
+) -> Dict[str, "pd.DataFrame"]:
     """
     Convert a list of Questions and QuestionGroups into two DataFrames.
 
@@ -1817,41 +1936,51 @@ def items_to_dfs(
     -------
     A dictionary containing a survey df and a choices df.
     """
-    survey_rows = []
-    choices_rows = []
+    import pandas as pd
+
     if items is None:
         raise ValueError("items_to_df found no items")
-    for item in items:
-        item_dict = item.dict()
-        type = item_dict["type"]
+
+    survey_rows: List[dict] = []
+    choices_rows: List[dict] = []
+
+    # one (remaining items, closing row) entry per open group, outermost first
+    stack: List[Tuple[Iterator[Union[QuestionGroup, Question]], Optional[dict]]] = [
+        (iter(items), None),
+    ]
+    while stack:
+        level_items, end_row = stack[-1]
+        item = next(level_items, None)
+        if item is None:
+            stack.pop()
+            if end_row is not None:
+                survey_rows.append(end_row)
+            continue
+
+        type = item.type
 
         if type in ("repeat", "group"):
-            del item_dict["items"]
-            item_dict.update({"type": f"begin {type}"})
-            survey_rows.append(item_dict)
-            _dfs = items_to_dfs(item.items)
-            survey_rows += _dfs["survey"].to_dict("records")
-            choices_rows += _dfs["choices"].to_dict("records")
-            item_dict.update({"type": f"end {type}"})
-            survey_rows.append(item_dict)
+            item_dict = item.model_dump(exclude={"items"})
+            survey_rows.append({**item_dict, "type": f"begin {type}"})
+            stack.append((iter(item.items), {**item_dict, "type": f"end {type}"}))
 
-        elif type in ("rank", "select_one", "select_multiple"):
+        elif type in _CHOICE_TYPES:
             list_name = item.name
-            del item_dict["choices"]
-            item_dict.update({"type": f"{type} {list_name}"})
+            item_dict = item.model_dump(exclude={"choices"})
+            item_dict["type"] = f"{type} {list_name}"
             survey_rows.append(item_dict)
             if item.choices is not None:
-                choices_rows += [
+                choices_rows.extend(
                     {
                         "list_name": list_name,
                         "name": choice.value,
                         "label": choice.label,
                     }
                     for choice in item.choices
-                ]
+                )
 
         else:
-            survey_rows.append(item_dict)
+            survey_rows.append(item.model_dump())
 
     survey_df = pd.DataFrame(survey_rows)
     choices_df = pd.DataFrame(choices_rows)
@@ -1859,36 +1988,58 @@ def items_to_dfs(
     return {"survey": survey_df, "choices": choices_df}
 
 
-def prep_for_excel(df: pd.DataFrame) -> pd.DataFrame:
+def _excel_cell(v: Any) -> Optional[str]:
+    """Return str cell value for XLSForm, or None for missing or empty values."""
+    if v is None or (isinstance(v, float) and v != v):  # v != v for nan
+        return None
+    if isinstance(v, bool):
+        return "yes" if v else "no"
+    v = str(v)
+    return None if v in ("", "[]", "{}") else v
+
+
+def prep_for_excel(df: "pd.DataFrame") -> "pd.DataFrame":
     """Perform transformations on data as needed for XLSForm parsing."""
-    return (
-        df.fillna("")
-        .astype(str)
-        .replace({"[]": "", "{}": ""}, regex=False)
-        .replace({"": None, True: "yes", False: "no"}, regex=False)
-        .dropna(axis=1, how="all")
+    import numpy as np
+    import pandas as pd
+
+    columns = {
+        # bool columns hold no missing values, so they map to yes/no in one pass
+        column: (
+            np.where(values.to_numpy(), "yes", "no").tolist()
+            if values.dtype == bool
+            else [_excel_cell(v) for v in values]
+        )
+        for column, values in df.items()
+    }
+    # drop columns with no values; object dtype keeps missing cells as None,
+    # where newer pandas would infer a string dtype that holds them as NaN
+    return pd.DataFrame(
+        {
+            column: cells
+            for column, cells in columns.items()
+            if any(cell is not None for cell in cells)
+        },
+        dtype=object,
     )
 
 
 def get_survey_args(excel_filepath: str) -> dict:
-    """Return Survey-parseable dict from Excel file."""
+    """
+    Return Survey-parseable dict from Excel file.
 
-    def link_choices(survey_row: dict, choice_dict: Dict[str, List[Choice]]) -> dict:
+    Items and choices are returned as plain dicts; they are validated once,
+    when the result is parsed into a Survey.
+    """
+    from openpyxl import load_workbook
+
+    def link_choices(survey_row: dict, choice_dict: Dict[str, List[dict]]) -> dict:
         """Link choices to questions."""
-        type = survey_row["type"]
-        type_with_choices = any(
-            type.startswith(s)
-            for s in (
-                "rank",
-                "select_one",
-                "select_multiple",
-            )
-        )
-        not_from_file = "from_file" not in type
-        if type_with_choices and not_from_file:
-            type_root, group_name = type.split()
-            survey_row["type"] = type_root
-            survey_row["choices"] = choice_dict.get(group_name, [])
+        # e.g. "select_one list_name"; *_from_file types are not in _CHOICE_TYPES
+        type_parts = survey_row["type"].split()
+        if len(type_parts) == 2 and type_parts[0] in _CHOICE_TYPES:
+            survey_row["type"], list_name = type_parts
+            survey_row["choices"] = choice_dict.get(list_name, [])
         return survey_row
 
     def group_items(rows: Iterable[dict]):
@@ -1900,64 +2051,57 @@ def get_survey_args(excel_filepath: str) -> dict:
             if type.startswith("begin"):
                 group_type = type[6:]
                 group_name = row["name"]
-                current_group = QuestionGroup(
-                    name=group_name,
-                    type=group_type,
-                    label=row.get("label", None),
-                    items=[],
-                )
+                current_group = {
+                    "name": group_name,
+                    "type": group_type,
+                    "label": row.get("label", None),
+                    "items": [],
+                }
                 groups.append(current_group)
             elif type.startswith("end") and current_group is not None:
                 current_group = None
             else:
                 if current_group is not None:
-                    current_group.items.append(Question.parse_obj(row))
+                    current_group["items"].append(row)
                 else:
-                    groups.append(Question.parse_obj(row))
+                    groups.append(row)
         return groups
 
-    def drop_nan_dict(df: pd.DataFrame) -> List[dict]:
-        """Return list of dicts with no nans."""
-        return [
-            {
-                k: v
-                for k, v in _dict.items()
-                if not (isinstance(v, float) and pd.isna(v))
+    def read_rows(sheet_rows: Iterable[tuple]) -> Iterator[dict]:
+        """Yield header: value dicts for non-empty rows, leaving out empty cells."""
+        sheet_rows = iter(sheet_rows)
+        header = next(sheet_rows, ())
+        for row in sheet_rows:
+            record = {
+                k: v for k, v in zip(header, row) if k is not None and v is not None
             }
-            for _dict in (
-                df.dropna(axis=0, how="all")
-                .dropna(axis=1, how="all")
-                .to_dict("records")
-            )
-        ]
-
-    def get_choice_dict(choices_df: pd.DataFrame) -> Dict[str, List[Choice]]:
-        """Return list_name: List[Choice] dict from choices_df."""
-        return {
-            list_name: [
-                Choice.parse_obj(d)
-                for d in drop_nan_dict(df.drop(columns=["list_name"]))
-            ]
-            for list_name, df in (
-                choices_df.rename(columns={"name": "value"}).groupby(
-                    "list_name",
-                    as_index=False,
-                )
-            )
-        }
-
-    with pd.ExcelFile(excel_filepath) as xls:
-        survey_df, choices_df, settings_df = (
-            pd.read_excel(xls, sheet_name=sheet_name)
+            if record:
+                yield record
+
+    def get_choice_dict(choice_rows: Iterable[dict]) -> Dict[str, List[dict]]:
+        """Return list_name: list of Choice-parseable dicts from choice rows."""
+        choice_dict: Dict[str, List[dict]] = {}
+        for row in choice_rows:
+            choice = {"value": row.get("name"), "label": row.get("label")}
+            choice_dict.setdefault(row.get("list_name"), []).append(choice)
+        return choice_dict
+
+    # read-only mode streams cell values without loading styles
+    workbook = load_workbook(excel_filepath, read_only=True, data_only=True)
+    try:
+        sheet_rows = {
+            sheet_name: read_rows(workbook[sheet_name].iter_rows(values_only=True))
             for sheet_name in ("survey", "choices", "settings")
+        }
+        choice_dict: Dict[str, List[dict]] = get_choice_dict(sheet_rows["choices"])
+        # survey rows stream from the sheet through link_choices into group_items
+        items_grouped = group_items(
+            link_choices(d, choice_dict) for d in sheet_rows["survey"]
         )
+        settings_dict = next(sheet_rows["settings"], {})
+    finally:
+        workbook.close()
 
-    choice_dict: Dict[str, List[Choice]] = get_choice_dict(choices_df)
-    items_grouped = group_items(
-        link_choices(d, choice_dict) for d in drop_nan_dict(survey_df)
-    )
-
-    settings_dict = settings_df.iloc[0].to_dict()
     settings_dict.update(
         {
             "name": settings_dict["form_id"],
@@ -1969,6 +2113,24 @@ def get_survey_args(excel_filepath: str) -> dict:
     return settings_dict
 
 
+@lru_cache(maxsize=32)
+def _cached_get_survey_args(excel_filepath: str, mtime_ns: int, size: int) -> dict:
+    """Return get_survey_args for one version of a file, keyed by its stat."""
+    return get_survey_args(excel_filepath)
+
+
+def _load_yaml(stream: Union[str, BinaryIO]) -> Any:
+    """Parse yaml str or binary stream, with LibYAML's C parser when available."""
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+    return yaml.load(stream, Loader=SafeLoader)
+
+
 class Survey(BaseModel):
     """
     A Pydantic model representing an XLSForm survey.
@@ -2016,14 +2178,26 @@ class Survey(BaseModel):
         description="the survey's items",
     )
 
-    def get_dfs(self) -> Dict[str, pd.DataFrame]:
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    def get_dfs(self) -> Dict[str, "pd.DataFrame"]:
         """Return sheet_name: df dict for survey data."""
-        settings_df = pd.DataFrame([{"form_id": self.name, "form_title": self.label}])
-        df_dict = items_to_dfs(self.items)
-        df_dict.update({"settings": settings_df})
-        df_dict = {sheet_name: prep_for_excel(df) for sheet_name, df in df_dict.items()}
+        import pandas as pd
+
+        df_dict = _cached_survey_dfs(self)
+        # copies, so callers cannot change the cached frames
+        df_dict = {sheet_name: df.copy() for sheet_name, df in df_dict.items()}
+        df_dict["settings"] = pd.DataFrame([self._settings_cells()])
         return df_dict
 
+    def _settings_cells(self) -> Dict[str, str]:
+        """Return column: cell dict for the single row of the settings sheet."""
+        cells = {
+            column: _excel_cell(v)
+            for column, v in (("form_id", self.name), ("form_title", self.label))
+        }
+        return {column: cell for column, cell in cells.items() if cell is not None}
+
     def save_to_excel(self, excel_filepath: str) -> None:
         """
         Save the survey data to an Excel file at the specified file path.
@@ -2037,9 +2211,32 @@ class Survey(BaseModel):
         -------
         None
         """
-        with pd.ExcelWriter(excel_filepath) as writer:
-            for sheet_name, df in self.get_dfs().items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        from xlsxwriter import Workbook
+
+        # constant_memory streams each row to disk as it is written;
+        # cell text is written as-is, never converted to formulas, urls or numbers
+        workbook_options = {
+            "constant_memory": True,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+            "strings_to_numbers": False,
+        }
+        with Workbook(excel_filepath, workbook_options) as workbook:
+            df_dict = _cached_survey_dfs(self)
+            for sheet_name, df in df_dict.items():
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, df.columns)
+                for row_number, row in enumerate(
+                    df.itertuples(index=False, name=None),
+                    start=1,
+                ):
+                    worksheet.write_row(row_number, 0, row)
+
+            # settings is a single constant row, so it skips pandas entirely
+            settings = self._settings_cells()
+            worksheet = workbook.add_worksheet("settings")
+            worksheet.write_row(0, 0, settings.keys())
+            worksheet.write_row(1, 0, settings.values())
 
     @classmethod
     def parse_excel(cls, excel_filepath: str) -> "Survey":
@@ -2055,21 +2252,36 @@ class Survey(BaseModel):
         -------
         A Survey object.
         """
-        survey_args = get_survey_args(excel_filepath)
-        return cls.parse_obj(survey_args)
+        excel_filepath = os.path.abspath(excel_filepath)
+        stat = os.stat(excel_filepath)
+        survey_args = _cached_get_survey_args(
+            excel_filepath,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        return cls.model_validate(survey_args)
 
     def yaml(self) -> str:
-        """Return yaml representation of self as str. Similar to Survey.json."""
+        """Return yaml representation of self as str. Similar to Survey.model_dump_json."""
+        import yaml
+
+        # LibYAML's C emitter when available
+        try:
+            from yaml import CSafeDumper as SafeDumper
+        except ImportError:
+            from yaml import SafeDumper
+
         return yaml.dump(
-            self.dict(exclude_none=True),
+            self.model_dump(exclude_none=True),
+            Dumper=SafeDumper,
             default_flow_style=False,
             sort_keys=False,
         )
 
     @classmethod
     def parse_yaml(cls, yaml_str: str) -> "Survey":
-        """Return Survey object given yaml str. Similar to Survey.parse_raw."""
-        return cls(**yaml.safe_load(yaml_str))
+        """Return Survey object given yaml str. Similar to Survey.model_validate_json."""
+        return cls(**_load_yaml(yaml_str))
 
     def save_to_yaml(self, yaml_filepath: str) -> None:
         """Save yaml representation of self to file."""
@@ -2079,6 +2291,28 @@ class Survey(BaseModel):
     @classmethod
     def parse_yaml_file(cls, yaml_filepath: str) -> "Survey":
         """Return Survey object given yaml filepath."""
-        with open(yaml_filepath) as in_file:
-            yaml_str = in_file.read()
-        return cls.parse_yaml(yaml_str)
+        # the parser reads and decodes the utf-8 file stream itself
+        with open(yaml_filepath, "rb") as in_file:
+            return cls(**_load_yaml(in_file))
+
+
+_SURVEY_DFS_CACHE_SIZE = 8
+_survey_dfs_cache: "OrderedDict[str, Dict[str, pd.DataFrame]]" = OrderedDict()
+
+
+def _cached_survey_dfs(survey: Survey) -> Dict[str, "pd.DataFrame"]:
+    """Return survey and choices dfs for survey, cached by its json."""
+    # a miss builds from survey.items, not by re-validating the json
+    survey_json = survey.model_dump_json()
+    df_dict = _survey_dfs_cache.get(survey_json)
+    if df_dict is None:
+        df_dict = {
+            sheet_name: prep_for_excel(df)
+            for sheet_name, df in items_to_dfs(survey.items).items()
+        }
+        _survey_dfs_cache[survey_json] = df_dict
+        if len(_survey_dfs_cache) > _SURVEY_DFS_CACHE_SIZE:
+            _survey_dfs_cache.popitem(last=False)
+    else:
+        _survey_dfs_cache.move_to_end(survey_json)
+    return df_dict